@@ -5,6 +5,8 @@ Main Application Entry Point
 
 import streamlit as st
 from utils.config import config
+from utils.gemini_helper import gemini
+from utils.prefetch import prefetch
 
 st.set_page_config(
     page_title="THY Cadet Pilot Prep",
@@ -13,6 +15,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Warm the AI cache for all enabled pages in the background (once per process; the precomputed
+# AI content bundle, if any, is imported when utils.gemini_helper is first loaded)
+prefetch.start(gemini)
+
 # Sidebar - AI Status
 with st.sidebar:
     st.markdown("### ⚙️ Settings")
@@ -36,6 +42,14 @@ with st.sidebar:
         
         if enabled_pages:
             st.caption(f"AI enabled for: {', '.join(enabled_pages)}")
+        
+        prefetch_status = prefetch.status()
+        if prefetch_status['pending']:
+            st.caption(f"⏳ Preparing AI content: {prefetch_status['done']}/{prefetch_status['done'] + prefetch_status['pending']} pages ready")
+        
+        salvage_stats = gemini.get_salvage_stats()
+        if salvage_stats['responses']:
+            st.caption(f"🩹 Recovered {salvage_stats['items']} items from {salvage_stats['responses']} malformed AI responses")
     else:
         st.markdown("""
         <div style="padding: 0.5rem; background: rgba(100, 100, 100, 0.15); border: 1px solid rgba(100, 100, 100, 0.4); border-radius: 8px; margin-bottom: 1rem;">
@@ -0,0 +1,173 @@
+"""
+Admin Page - Response cache invalidation, AI job queue and Gemini call metrics (latency percentiles, tokens, cache hit ratio)
+"""
+
+import streamlit as st
+import sys
+import hmac
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.config import config
+from utils.gemini_helper import gemini
+from utils.metrics import metrics
+from utils.jobs import jobs, PRIORITY_NAMES
+
+st.set_page_config(
+    page_title="Admin | Cadet Prep",
+    page_icon="🛠️",
+    layout="wide"
+)
+
+# Custom CSS
+st.markdown("""
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@300;400;500;600;700&display=swap');
+
+    .stApp {
+        background: linear-gradient(135deg, #0a0a1a 0%, #1a1a2e 50%, #16213e 100%);
+    }
+
+    .page-header {
+        font-family: 'Orbitron', monospace;
+        font-size: 2.5rem;
+        font-weight: 700;
+        color: #c8102e;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+st.markdown('<h1 class="page-header">🛠️ Admin</h1>', unsafe_allow_html=True)
+
+# Access control
+admin_password = config.admin_password
+if not admin_password:
+    st.info("The admin page is disabled. Set `admin.password` in config.yaml, the ADMIN_PASSWORD "
+            "environment variable or `[admin] password` in Streamlit Secrets to enable it.")
+    st.stop()
+
+if not st.session_state.get('admin_authenticated'):
+    password = st.text_input("Admin password", type="password")
+    if password:
+        if hmac.compare_digest(password, admin_password):
+            st.session_state.admin_authenticated = True
+            st.rerun()
+        st.error("Incorrect password")
+    st.stop()
+
+
+def _format_ms(value):
+    return "—" if value is None else f"{value:,.0f} ms"
+
+
+def _format_ratio(value):
+    return "—" if value is None else f"{value:.0%}"
+
+
+def _summary_table(groups):
+    """Turn {name: summary} into a table with one row per group"""
+    return pd.DataFrame([
+        {
+            'Name': name,
+            'Calls': s['calls'],
+            'p50': _format_ms(s['p50_ms']),
+            'p95': _format_ms(s['p95_ms']),
+            'p99': _format_ms(s['p99_ms']),
+            'Cache hit ratio': _format_ratio(s['cache_hit_ratio']),
+            'Semantic hit ratio': _format_ratio(s['semantic_hit_ratio']),
+            'Prompt tokens': s['prompt_tokens'],
+            'Response tokens': s['response_tokens'],
+        }
+        for name, s in groups.items()
+    ])
+
+
+st.markdown("### 🗑️ Response Cache")
+st.caption("Invalidating a page makes all of its cached responses unreachable at once; "
+           "the next request generates fresh content. Page histories are kept.")
+cache_pages = ['dictionary', 'news', 'history', 'fleet', 'destinations', 'future', 'training_aircraft']
+col1, col2 = st.columns([3, 1])
+with col1:
+    invalidate_page = st.selectbox("Page", cache_pages, label_visibility="collapsed")
+with col2:
+    if st.button("Invalidate cache", use_container_width=True):
+        generation = gemini.invalidate_cache(invalidate_page)
+        st.success(f"Invalidated cached responses for {invalidate_page} (generation {generation})")
+
+st.markdown("### 🧵 AI Job Queue")
+st.caption("Queued and running generations of all processes, most urgent first.")
+pending_jobs = jobs.pending()
+cols = st.columns(len(PRIORITY_NAMES))
+for col, name in zip(cols, PRIORITY_NAMES.values()):
+    col.metric(name.capitalize(), pending_jobs.get(name, 0))
+
+st.markdown("### 📈 Gemini Calls")
+st.caption(f"Rolling window of the last {config.metrics_window_size} calls in this process. "
+           "Every call is also logged to `.cache/gemini_calls.jsonl`.")
+
+if not config.metrics_enabled:
+    st.warning("Call metrics are disabled (`metrics.enabled` in config.yaml).")
+
+overall = metrics.summary()
+if not overall['calls']:
+    st.info("No Gemini calls recorded yet.")
+    st.stop()
+
+col1, col2, col3, col4, col5 = st.columns(5)
+col1.metric("Calls", overall['calls'])
+col2.metric("p50 latency", _format_ms(overall['p50_ms']))
+col3.metric("p95 latency", _format_ms(overall['p95_ms']))
+col4.metric("p99 latency", _format_ms(overall['p99_ms']))
+col5.metric("Cache hit ratio", _format_ratio(overall['cache_hit_ratio']))
+
+col1, col2, col3, col4, col5 = st.columns(5)
+col1.metric("Prompt tokens", f"{overall['prompt_tokens']:,}")
+col2.metric("Response tokens", f"{overall['response_tokens']:,}")
+salvage_stats = gemini.get_salvage_stats()
+col3.metric("Salvaged responses", salvage_stats['responses'])
+col4.metric("Semantic hit ratio", _format_ratio(overall['semantic_hit_ratio']))
+if config.cache_semantic_enabled:
+    semantic_stats = gemini.get_semantic_stats()
+    col5.metric("Semantic index", f"{semantic_stats['entries']:,} prompts",
+                help=f"{semantic_stats['hits']} hits in {semantic_stats['lookups']} lookups at similarity "
+                     f"≥ {config.cache_semantic_threshold}")
+else:
+    col5.metric("Semantic index", "Off", help="Enable with cache.semantic_enabled in config.yaml")
+
+st.markdown("#### Latency distribution")
+histogram = metrics.latency_histogram()
+st.bar_chart(pd.DataFrame({'Calls': list(histogram.values())}, index=list(histogram.keys())))
+
+st.markdown("#### Outcomes")
+st.bar_chart(pd.DataFrame({'Calls': list(overall['outcomes'].values())}, index=list(overall['outcomes'].keys())))
+
+events = metrics.events()
+st.markdown("#### Cache tiers")
+tiers = {}
+for e in events:
+    if e.get('cache_tier'):
+        tiers[e['cache_tier']] = tiers.get(e['cache_tier'], 0) + 1
+if tiers:
+    st.bar_chart(pd.DataFrame({'Lookups': list(tiers.values())}, index=list(tiers.keys())))
+else:
+    st.caption("No cache lookups recorded.")
+
+st.markdown("#### By page")
+st.dataframe(_summary_table(metrics.summary(group_by='page')), hide_index=True, use_container_width=True)
+
+st.markdown("#### By model")
+st.dataframe(_summary_table(metrics.summary(group_by='model')), hide_index=True, use_container_width=True)
+
+with st.expander("Recent calls"):
+    st.dataframe(pd.DataFrame(list(reversed(events[-100:]))), hide_index=True, use_container_width=True)
+
+# Back button
+st.markdown("<br>", unsafe_allow_html=True)
+if st.button("← Back to Home"):
+    st.switch_page("app.py")
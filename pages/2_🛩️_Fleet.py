@@ -3,7 +3,6 @@ Turkish Airlines Fleet Page
 """
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import sys
@@ -13,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config import config
+from utils import data
 from utils.gemini_helper import gemini, render_ai_section
 
 st.set_page_config(
@@ -72,25 +72,7 @@ st.markdown("""
 # Fleet data - Updated from THY Investor Relations (January 2026)
 # Source: https://investor.turkishairlines.com/en/financial-and-operational/fleet
 # Total: 516 aircraft (142 Wide-body + 347 Narrow-body + 27 Cargo)
-
-fleet_data = {
-    "Manufacturer": ["Airbus", "Airbus", "Airbus", "Airbus", "Airbus",
-                     "Boeing", "Boeing", "Boeing", "Boeing", "Boeing", "Boeing"],
-    "Model": ["A319/A320/A321 (Classic)", "A320neo/A321neo", "A330-200/300", "A350-900", "A350F",
-              "737-800/900", "737 MAX 8/9", "777-300ER", "787-9", "777F", "747-400F"],
-    "Type": ["Narrow-body", "Narrow-body", "Wide-body", "Wide-body", "Freighter",
-             "Narrow-body", "Narrow-body", "Wide-body", "Wide-body", "Freighter", "Freighter"],
-    "Count": [101, 105, 49, 33, 4,
-              99, 42, 34, 26, 17, 6],
-    "Passengers": ["132-220", "165-240", "264-330", "329", "Cargo",
-                   "151-189", "151-188", "349-377", "270-300", "Cargo", "Cargo"],
-    "Range_km": [6100, 7400, 12500, 15000, 8700,
-                 5700, 6500, 13650, 14000, 9200, 8230],
-    "Status": ["Active", "Active", "Active", "Active", "Active",
-               "Active", "Active", "Active", "Active", "Active", "Active"]
-}
-
-df = pd.DataFrame(fleet_data)
+df = data.fleet()
 
 # Summary statistics
 total_aircraft = df['Count'].sum()
@@ -224,19 +206,7 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-orders_data = {
-    "Aircraft": ["Boeing 787-9", "Airbus A350-900", "Boeing 737 MAX 8", "Boeing 737 MAX 10", "Airbus A321neo"],
-    "On Order": [25, 15, 40, 20, 20],
-    "Expected Delivery": ["2024-2028", "2024-2027", "2024-2028", "2025-2028", "2024-2027"],
-    "Notes": [
-        "Long-haul expansion", 
-        "Fleet modernization", 
-        "Narrow-body refresh", 
-        "Largest MAX variant",
-        "Fuel-efficient single-aisle"
-    ]
-}
-orders_df = pd.DataFrame(orders_data)
+orders_df = data.fleet_orders()
 st.dataframe(orders_df, use_container_width=True, hide_index=True)
 
 # Key Points for Interview
@@ -261,13 +231,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # AI Insights Section
-fleet_summary = """
-- Total Fleet: 516 aircraft
-- Wide-body: 142 (B777-300ER: 34, A350-900: 33, B787-9: 26, A330: 49)
-- Narrow-body: 347 (A321neo: 108, A321: 68, A320: 30, B737 MAX 8/9: 76, B737-800/900: 65)
-- Cargo: 27 freighters (B777F: 7, A350F: 3, B747-400F: 4, A330-200F: 10, A321F: 3)
-- Hub: Istanbul Airport (IST)
-"""
+fleet_summary = data.fleet_summary()
 
 render_ai_section(
     page_name='fleet',
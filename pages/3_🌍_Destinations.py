@@ -3,7 +3,6 @@ Turkish Airlines Destinations Page with Interactive World Map
 """
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import sys
@@ -13,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config import config
+from utils import data
 from utils.gemini_helper import gemini, render_ai_section
 
 st.set_page_config(
@@ -62,95 +62,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Destination data by country with ISO codes for map (sample of major countries)
-destinations_data = {
-    "Country": ["Turkey", "Germany", "United States", "United Kingdom", "France", "Italy", 
-                "Russia", "Saudi Arabia", "UAE", "Netherlands", "Spain", "Switzerland",
-                "Austria", "Belgium", "Poland", "Ukraine", "Greece", "Morocco", "Egypt",
-                "South Africa", "Nigeria", "Kenya", "Ethiopia", "Algeria", "Tunisia",
-                "India", "Pakistan", "China", "Japan", "South Korea", "Thailand",
-                "Indonesia", "Malaysia", "Singapore", "Australia", "Brazil", "Argentina",
-                "Mexico", "Canada", "Iran", "Iraq", "Kazakhstan", "Azerbaijan", "Georgia",
-                "Israel", "Jordan", "Lebanon", "Kuwait", "Qatar", "Bahrain", "Oman",
-                "Libya", "Senegal", "Ghana", "Tanzania", "Rwanda", "Uganda", "Mozambique",
-                "Mauritius", "Madagascar", "Seychelles", "Maldives", "Sri Lanka", "Bangladesh",
-                "Vietnam", "Philippines", "Hong Kong", "Taiwan", "Mongolia", "Uzbekistan",
-                "Turkmenistan", "Tajikistan", "Kyrgyzstan", "Afghanistan", "Nepal",
-                "Colombia", "Chile", "Peru", "Panama", "Cuba", "Dominican Republic",
-                "Portugal", "Ireland", "Norway", "Sweden", "Denmark", "Finland",
-                "Czech Republic", "Hungary", "Romania", "Bulgaria", "Serbia", "Croatia",
-                "Slovenia", "Bosnia", "Montenegro", "Albania", "North Macedonia", "Kosovo",
-                "Cyprus", "Malta", "Luxembourg", "Iceland"],
-    "ISO": ["TUR", "DEU", "USA", "GBR", "FRA", "ITA", 
-            "RUS", "SAU", "ARE", "NLD", "ESP", "CHE",
-            "AUT", "BEL", "POL", "UKR", "GRC", "MAR", "EGY",
-            "ZAF", "NGA", "KEN", "ETH", "DZA", "TUN",
-            "IND", "PAK", "CHN", "JPN", "KOR", "THA",
-            "IDN", "MYS", "SGP", "AUS", "BRA", "ARG",
-            "MEX", "CAN", "IRN", "IRQ", "KAZ", "AZE", "GEO",
-            "ISR", "JOR", "LBN", "KWT", "QAT", "BHR", "OMN",
-            "LBY", "SEN", "GHA", "TZA", "RWA", "UGA", "MOZ",
-            "MUS", "MDG", "SYC", "MDV", "LKA", "BGD",
-            "VNM", "PHL", "HKG", "TWN", "MNG", "UZB",
-            "TKM", "TJK", "KGZ", "AFG", "NPL",
-            "COL", "CHL", "PER", "PAN", "CUB", "DOM",
-            "PRT", "IRL", "NOR", "SWE", "DNK", "FIN",
-            "CZE", "HUN", "ROU", "BGR", "SRB", "HRV",
-            "SVN", "BIH", "MNE", "ALB", "MKD", "XKX",
-            "CYP", "MLT", "LUX", "ISL"],
-    "Destinations": [53, 12, 13, 6, 5, 8, 
-                     8, 6, 3, 2, 4, 4,
-                     2, 2, 3, 4, 4, 5, 3,
-                     3, 3, 2, 2, 3, 2,
-                     10, 5, 7, 4, 2, 2,
-                     4, 2, 1, 2, 3, 2,
-                     3, 4, 5, 5, 4, 2, 2,
-                     2, 1, 1, 1, 1, 1, 1,
-                     2, 1, 1, 2, 1, 1, 1,
-                     1, 1, 1, 1, 1, 2,
-                     2, 2, 1, 1, 1, 2,
-                     1, 1, 1, 1, 1,
-                     2, 1, 1, 1, 1, 1,
-                     2, 1, 2, 2, 2, 1,
-                     1, 1, 2, 2, 1, 2,
-                     1, 1, 1, 1, 1, 1,
-                     2, 1, 1, 1],
-    "Region": ["Europe", "Europe", "Americas", "Europe", "Europe", "Europe",
-               "Europe", "Middle East", "Middle East", "Europe", "Europe", "Europe",
-               "Europe", "Europe", "Europe", "Europe", "Europe", "Africa", "Africa",
-               "Africa", "Africa", "Africa", "Africa", "Africa", "Africa",
-               "Asia", "Asia", "Asia", "Asia", "Asia", "Asia",
-               "Asia", "Asia", "Asia", "Oceania", "Americas", "Americas",
-               "Americas", "Americas", "Middle East", "Middle East", "Asia", "Europe", "Europe",
-               "Middle East", "Middle East", "Middle East", "Middle East", "Middle East", "Middle East", "Middle East",
-               "Africa", "Africa", "Africa", "Africa", "Africa", "Africa", "Africa",
-               "Africa", "Africa", "Africa", "Asia", "Asia", "Asia",
-               "Asia", "Asia", "Asia", "Asia", "Asia", "Asia",
-               "Asia", "Asia", "Asia", "Asia", "Asia",
-               "Americas", "Americas", "Americas", "Americas", "Americas", "Americas",
-               "Europe", "Europe", "Europe", "Europe", "Europe", "Europe",
-               "Europe", "Europe", "Europe", "Europe", "Europe", "Europe",
-               "Europe", "Europe", "Europe", "Europe", "Europe", "Europe",
-               "Europe", "Europe", "Europe", "Europe"],
-    "Weekly_Flights": [500, 140, 98, 70, 56, 70,
-                       84, 70, 56, 35, 42, 49,
-                       28, 28, 35, 42, 56, 42, 35,
-                       28, 21, 21, 21, 28, 21,
-                       70, 35, 56, 42, 28, 28,
-                       28, 21, 21, 21, 21, 14,
-                       28, 35, 35, 42, 28, 21, 28,
-                       21, 21, 21, 21, 21, 14, 14,
-                       14, 7, 7, 14, 7, 7, 7,
-                       7, 7, 7, 14, 14, 14,
-                       14, 14, 14, 7, 7, 14,
-                       7, 7, 7, 7, 7,
-                       14, 7, 7, 7, 7, 7,
-                       21, 14, 21, 28, 28, 14,
-                       14, 14, 28, 21, 14, 21,
-                       14, 14, 7, 14, 7, 7,
-                       21, 14, 7, 7]
-}
-
-df = pd.DataFrame(destinations_data)
+df = data.destinations()
 
 # Summary stats - Official figures from THY Investor Relations
 col1, col2, col3, col4, col5 = st.columns(5)
@@ -227,9 +139,10 @@ with tab1:
         "South Korea": (36.0, 128.0), "Brazil": (-14.0, -51.0), "Australia": (-25.0, 133.0)
     }
     
-    df_coords = df.copy()
-    df_coords['Lat'] = df_coords['Country'].map(lambda x: coords.get(x, (0, 0))[0])
-    df_coords['Lon'] = df_coords['Country'].map(lambda x: coords.get(x, (0, 0))[1])
+    df_coords = df.assign(
+        Lat=df['Country'].map(lambda x: coords.get(x, (0, 0))[0]),
+        Lon=df['Country'].map(lambda x: coords.get(x, (0, 0))[1])
+    )
     df_coords = df_coords[df_coords['Lat'] != 0]
     
     fig2 = px.scatter_geo(
@@ -321,7 +234,7 @@ with tab3:
         sort_by = st.selectbox("Sort by", ["Destinations", "Weekly_Flights", "Country"])
     
     # Apply filters
-    filtered_df = df.copy()
+    filtered_df = df
     if region_filter:
         filtered_df = filtered_df[filtered_df['Region'].isin(region_filter)]
     
@@ -357,14 +270,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # AI Insights Section
-destinations_summary = """
-- Total Destinations: 356 (53 domestic, 303 international)
-- Countries Served: 132 countries
-- Hub: Istanbul Airport (IST) - world's largest airport terminal
-- Key Markets: Europe (dominant), Middle East, Africa, Asia, Americas
-- Star Alliance member since 2008
-- Unique Advantage: Istanbul's geographic position allows one-stop connections to most of the world
-"""
+destinations_summary = data.destinations_summary()
 
 render_ai_section(
     page_name='destinations',
@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config import config
+from utils import data
 from utils.gemini_helper import gemini, render_ai_section
 
 st.set_page_config(
@@ -417,11 +418,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # AI Insights Section
-existing_topics = [
-    "Electric Aircraft", "Sustainable Aviation Fuel", "Urban Air Mobility",
-    "Autonomous Flight", "Advanced Air Mobility", "Hydrogen Aircraft",
-    "Next-Gen ATC", "Supersonic Revival", "Space Tourism"
-]
+existing_topics = data.future_topics()
 
 render_ai_section(
     page_name='future',
@@ -0,0 +1,8 @@
+"""
+Shared test setup for THY Cadet Pilot Prep App
+Tests run against the fake Gemini backend, so they never call the API
+"""
+
+import os
+
+os.environ['GEMINI_BACKEND'] = 'fake'
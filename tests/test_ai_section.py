@@ -0,0 +1,33 @@
+"""
+Tests for the AI sections of THY Cadet Pilot Prep App
+Run from the repository root with: python -m pytest tests
+"""
+
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from utils.gemini_backends import FakeModel
+
+NEWS_PAGE = "pages/7_📰_Aviation_News.py"
+
+
+def _run_until(at: AppTest, condition, timeout: float = 15.0) -> AppTest:
+    """Rerun the page until condition(at) holds, since generation jobs finish on worker threads"""
+    deadline = time.monotonic() + timeout
+    while not condition(at) and time.monotonic() < deadline:
+        time.sleep(0.2)
+        at.run()
+    return at
+
+
+def test_failed_fresh_response_shows_error(monkeypatch):
+    def fail(self, prompt, **kwargs):
+        raise RuntimeError("backend unreachable")
+
+    monkeypatch.setattr(FakeModel, 'generate_content', fail)
+    at = AppTest.from_file(NEWS_PAGE, default_timeout=30).run()
+    at.button(key="fresh_news").click().run()
+    _run_until(at, lambda at: at.error)
+
+    assert [e.value for e in at.error] == ["Gemini API error: backend unreachable"]
@@ -0,0 +1,56 @@
+"""
+Tests for the Gemini helper of THY Cadet Pilot Prep App
+Run from the repository root with: python -m pytest tests
+"""
+
+import json
+from types import SimpleNamespace
+
+from utils import data
+from utils.gemini_backends import FakeModel
+from utils.gemini_helper import gemini
+
+INSIGHT_PAGES = ('fleet', 'destinations', 'future')
+
+
+def test_failed_batch_falls_back_to_each_page(monkeypatch):
+    generate_content = FakeModel.generate_content
+    calls = []
+
+    def fail_batches(self, prompt, page_name=None, **kwargs):
+        calls.append(page_name)
+        if '+' in page_name:
+            raise RuntimeError("batch call failed")
+        return generate_content(self, prompt, page_name=page_name, **kwargs)
+
+    monkeypatch.setattr(FakeModel, 'generate_content', fail_batches)
+    generators = data.ai_page_generators()
+    results = gemini.get_insights_batch({page: generators[page][1] for page in INSIGHT_PAGES}, use_cache=False)
+
+    assert calls == ['+'.join(INSIGHT_PAGES), *INSIGHT_PAGES]
+    assert all(results[page] for page in INSIGHT_PAGES)
+
+
+def test_dictionary_round_without_new_terms_is_not_cached(monkeypatch):
+    generate_content = FakeModel.generate_content
+    existing_terms = data.dictionary()['term'].tolist()
+    known_only = [
+        {'term': row.term, 'full_name': row.full_name, 'category': row.category,
+         'difficulty': row.difficulty, 'definition': row.definition}
+        for row in data.dictionary().head(5).itertuples()
+    ]
+    responses = {'known_only': True}
+
+    def known_then_new(self, prompt, **kwargs):
+        if responses['known_only']:
+            return SimpleNamespace(text=json.dumps(known_only))
+        return generate_content(self, prompt, **kwargs)
+
+    monkeypatch.setattr(FakeModel, 'generate_content', known_then_new)
+    gemini.invalidate_cache('dictionary')
+    assert gemini.get_dictionary_additions(existing_terms, use_cache=True) == []
+
+    responses['known_only'] = False
+    new_terms = gemini.get_dictionary_additions(existing_terms, use_cache=True)
+    assert new_terms
+    assert not {item['term'] for item in new_terms} & set(existing_terms)
@@ -0,0 +1,39 @@
+"""
+Tests for the JSON parsing helpers of THY Cadet Pilot Prep App
+Run from the repository root with: python -m pytest tests
+"""
+
+from utils.json_parser import JSONArrayStreamParser, salvage_json_array, salvage_json_sections
+
+
+def test_stream_parser_emits_items_as_they_complete():
+    parser = JSONArrayStreamParser()
+    assert parser.feed('```json\n[{"term": "ATC"}, {"te') == [{"term": "ATC"}]
+    assert parser.feed('rm": "ILS"}]\n```') == [{"term": "ILS"}]
+    assert parser.finished
+
+
+def test_salvage_repairs_trailing_commas_and_drops_truncated_item():
+    text = '[{"term": "ATC",}, {"term": "ILS"}, {"term": "VO'
+    assert salvage_json_array(text) == [{"term": "ATC"}, {"term": "ILS"}]
+
+
+def test_salvage_skips_bracketed_prose_before_the_array():
+    text = '[Note] Here are the items: [{"term": "ATC"}, {"term": "ILS"}]'
+    assert salvage_json_array(text) == [{"term": "ATC"}, {"term": "ILS"}]
+
+
+def test_salvage_collects_bare_objects():
+    assert salvage_json_array('Sure! {"term": "ATC"}, {"term": "ILS"}') == [{"term": "ATC"}, {"term": "ILS"}]
+
+
+def test_salvage_without_json_returns_empty_list():
+    assert salvage_json_array('[Note] No items today.') == []
+
+
+def test_salvage_sections_keeps_intact_sections():
+    text = '{"fleet": [{"model": "A350"}], "future": [{"topic": "SAF"}, {"to'
+    assert salvage_json_sections(text, ['fleet', 'future', 'destinations']) == {
+        'fleet': [{"model": "A350"}],
+        'future': [{"topic": "SAF"}],
+    }
@@ -0,0 +1,319 @@
+"""
+Response Cache Store for THY Cadet Pilot Prep App
+In-process LRU tier in front of a SQLite-backed (WAL mode) cache shared by all Streamlit worker processes
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a SQLite connection configured for concurrent multi-process access"""
+    conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+class ResponseCache:
+    """Persistent response cache with TTL expiry and size-capped LRU eviction"""
+
+    # Only refresh last_access if it is older than this, to avoid a write on every hit
+    ACCESS_RESOLUTION_SECONDS = 60
+
+    def __init__(self, db_path: Path, max_bytes: int):
+        self._db_path = db_path
+        self._max_bytes = max_bytes
+        self._local = threading.local()
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get the connection for the current thread (sqlite3 connections are not thread-safe)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self._db_path)
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """Create tables and indexes if they don't exist"""
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_expires ON responses(expires_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS namespace_generations (
+                namespace TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL
+            )
+        """)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value if present and not expired"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, float]]:
+        """Get a cached (value, expires_at) pair if present and not expired"""
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, expires_at, last_access FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at, last_access = row
+            if now - last_access > self.ACCESS_RESOLUTION_SECONDS:
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            return value, expires_at
+        except sqlite3.Error:
+            return None
+
+    def put(self, key: str, value: str, ttl_seconds: float, created_at: Optional[float] = None):
+        """Store a value and evict expired/least recently used entries over the size cap"""
+        now = time.time()
+        created_at = created_at if created_at is not None else now
+        size = len(value.encode('utf-8'))
+        if size > self._max_bytes:
+            return
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, size, created_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, value, size, created_at, created_at + ttl_seconds, now)
+                )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired entries, then least recently used ones until under the size cap"""
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        overflow = total - self._max_bytes
+        if overflow <= 0:
+            return
+
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            victims.append((key,))
+            overflow -= size
+            if overflow <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        try:
+            self._conn().execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """Remove all entries"""
+        try:
+            self._conn().execute("DELETE FROM responses")
+        except sqlite3.Error:
+            pass
+
+    def generation(self, namespace: str) -> int:
+        """Get the current generation of a key namespace (0 until it is first invalidated)"""
+        try:
+            row = self._conn().execute(
+                "SELECT generation FROM namespace_generations WHERE namespace = ?", (namespace,)
+            ).fetchone()
+            return row[0] if row else 0
+        except sqlite3.Error:
+            return 0
+
+    def invalidate(self, namespace: str) -> int:
+        """Bump a namespace's generation so keys built from the old one are never looked up again"""
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT INTO namespace_generations (namespace, generation) VALUES (?, 1) "
+                    "ON CONFLICT(namespace) DO UPDATE SET generation = generation + 1",
+                    (namespace,)
+                )
+                generation = conn.execute(
+                    "SELECT generation FROM namespace_generations WHERE namespace = ?", (namespace,)
+                ).fetchone()[0]
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            return self.generation(namespace)
+        return generation
+
+    def entries(self) -> List[Tuple[str, str, float]]:
+        """Get (key, value, created_at) for every unexpired entry, e.g. to export the cache"""
+        try:
+            return self._conn().execute(
+                "SELECT key, value, created_at FROM responses WHERE expires_at > ? ORDER BY created_at",
+                (time.time(),)
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry count and total size of the cache"""
+        try:
+            count, total = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {'entries': count, 'bytes': total, 'max_bytes': self._max_bytes}
+        except sqlite3.Error:
+            return {'entries': 0, 'bytes': 0, 'max_bytes': self._max_bytes}
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with TTL expiry and a byte-size bound"""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached value if present and not expired, marking it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, size = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._bytes -= size
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str, expires_at: float):
+        """Store a value until expires_at, evicting least recently used entries over the size cap"""
+        size = len(value.encode('utf-8'))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get entry count and total size of the cache"""
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes, 'max_bytes': self._max_bytes}
+
+
+class TieredCache:
+    """Two-tier response cache: process-wide memory LRU backed by the shared SQLite store"""
+
+    # How long a namespace generation read from disk is reused; invalidations in other processes
+    # take effect here within this time, and in this process immediately
+    GENERATION_TTL_SECONDS = 2
+
+    def __init__(self, memory: MemoryCache, disk: ResponseCache):
+        self.memory = memory
+        self.disk = disk
+        self._generations_lock = threading.Lock()
+        # namespace -> (generation, monotonic time it was read)
+        self._generations: Dict[str, Tuple[int, float]] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a value from memory, falling back to disk and promoting disk hits into memory"""
+        return self.get_with_tier(key)[0]
+
+    def get_with_tier(self, key: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get (value, tier) where tier is 'memory', 'disk' or None on a miss"""
+        value = self.memory.get(key)
+        if value is not None:
+            return value, 'memory'
+        entry = self.disk.get_entry(key)
+        if entry is None:
+            return None, None
+        value, expires_at = entry
+        self.memory.put(key, value, expires_at)
+        return value, 'disk'
+
+    def put(self, key: str, value: str, ttl_seconds: float, created_at: Optional[float] = None):
+        """Store a value in both tiers"""
+        created_at = created_at if created_at is not None else time.time()
+        self.disk.put(key, value, ttl_seconds, created_at=created_at)
+        self.memory.put(key, value, created_at + ttl_seconds)
+
+    def generation(self, namespace: str) -> int:
+        """Get the current generation of a key namespace (shared by all processes via the disk tier)
+
+        Read from disk at most every GENERATION_TTL_SECONDS, so building a key for a memory hit
+        needs no database query.
+        """
+        now = time.monotonic()
+        with self._generations_lock:
+            cached = self._generations.get(namespace)
+        if cached is not None and now - cached[1] < self.GENERATION_TTL_SECONDS:
+            return cached[0]
+        generation = self.disk.generation(namespace)
+        with self._generations_lock:
+            self._generations[namespace] = (generation, now)
+        return generation
+
+    def invalidate(self, namespace: str) -> int:
+        """Bump a namespace's generation; entries in both tiers keyed by the old one become unreachable"""
+        generation = self.disk.invalidate(namespace)
+        with self._generations_lock:
+            self._generations[namespace] = (generation, time.monotonic())
+        return generation
+
+    def delete(self, key: str):
+        """Remove a single entry from both tiers"""
+        self.memory.delete(key)
+        self.disk.delete(key)
+
+    def clear(self):
+        """Remove all entries from both tiers"""
+        self.memory.clear()
+        self.disk.clear()
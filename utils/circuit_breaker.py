@@ -0,0 +1,95 @@
+"""
+Circuit Breaker for THY Cadet Pilot Prep App
+Stops calling Gemini after repeated failures so pages render instantly from saved content
+"""
+
+import threading
+import time
+
+from utils.config import config
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Classic closed/open/half-open circuit breaker shared by all sessions in the process
+
+    Opens after failure_threshold consecutive failures. After recovery_seconds one probe call is
+    let through (half-open); its success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float):
+        self._failure_threshold = failure_threshold
+        self._recovery_seconds = recovery_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the recovery time has passed"""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._recovery_seconds:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Check if calls are currently being rejected (open, or half-open with a probe running)"""
+        with self._lock:
+            state = self._current_state()
+            return state == self.OPEN or (state == self.HALF_OPEN and self._probe_in_flight)
+
+    def retry_in(self) -> float:
+        """Seconds until the next recovery probe is allowed"""
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(0.0, self._recovery_seconds - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Check if a call may go ahead; in half-open state only a single probe is allowed"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """Record a successful call, closing the circuit"""
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """Record a failed or timed out call, opening the circuit at the threshold or on a failed probe"""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self):
+        """Give up an allowed call that never reached the API, without counting it either way"""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+# Singleton instance
+circuit_breaker = CircuitBreaker(config.circuit_failure_threshold, config.circuit_recovery_seconds)
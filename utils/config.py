@@ -7,6 +7,9 @@ import os
 import yaml
 from pathlib import Path
 
+# Gemini backends: live API, live API recorded to a cassette, cassette replay, generated fake data
+GEMINI_BACKENDS = ('live', 'record', 'replay', 'fake')
+
 
 class Config:
     """Configuration manager singleton"""
@@ -32,7 +35,23 @@ class Config:
                 'gemini': {
                     'api_key': '',
                     'model': 'gemini-1.5-flash',
-                    'enabled': False
+                    'enabled': False,
+                    'stream': True,
+                    'json_mode': True,
+                    'batch_insights': True,
+                    'cache_only': False,
+                    'model_list_ttl_hours': 24,
+                    'request_timeout_seconds': 30,
+                    'deadline_seconds': 45,
+                    'backend': 'live',
+                    'cassette_file': '.cache/gemini_cassette.jsonl',
+                    'replay_latency': 'recorded',
+                    'replay_seed': 0,
+                    'synthetic_latency_ms': 1500
+                },
+                'circuit_breaker': {
+                    'failure_threshold': 5,
+                    'recovery_seconds': 60
                 },
                 'ai_enhancements': {
                     'dictionary': False,
@@ -48,9 +67,49 @@ class Config:
                     'indicator_color': '#9b59b6',
                     'show_disclaimer': True
                 },
+                'ai_freshness': {
+                    'default': 24
+                },
+                'dictionary_topup': {
+                    'target_terms': 15,
+                    'max_requests': 3
+                },
+                'rate_limit': {
+                    'requests_per_minute': 15,
+                    'tokens_per_minute': 250000,
+                    'max_retries': 4,
+                    'backoff_base_seconds': 1,
+                    'backoff_max_seconds': 30
+                },
+                'prefetch': {
+                    'enabled': True,
+                    'max_workers': 3
+                },
+                'jobs': {
+                    'max_workers': 4,
+                    'aging_seconds': 60
+                },
+                'precompute': {
+                    'max_workers': 3,
+                    'bundle_file': 'ai_bundle.json.gz'
+                },
                 'cache': {
                     'enabled': True,
-                    'duration_hours': 24
+                    'duration_hours': 24,
+                    'max_size_mb': 50,
+                    'memory_max_mb': 8,
+                    'history_retention': 5,
+                    'semantic_enabled': False,
+                    'semantic_threshold': 0.92,
+                    'semantic_max_entries': 2000
+                },
+                'metrics': {
+                    'enabled': True,
+                    'window_size': 1000,
+                    'max_log_mb': 10
+                },
+                'admin': {
+                    'password': ''
                 }
             }
     
@@ -84,10 +143,88 @@ class Config:
         """Get Gemini model name"""
         return self._config.get('gemini', {}).get('model', 'gemini-1.5-flash')
     
+    @property
+    def gemini_model_list_ttl_hours(self) -> float:
+        """Get how long the list of available Gemini models is cached on disk"""
+        return self._config.get('gemini', {}).get('model_list_ttl_hours', 24)
+    
+    @property
+    def gemini_request_timeout_seconds(self) -> float:
+        """Get timeout for a single Gemini API request"""
+        return self._config.get('gemini', {}).get('request_timeout_seconds', 30)
+    
+    @property
+    def gemini_json_mode(self) -> bool:
+        """Check if structured JSON output should be requested with a per-page response schema"""
+        return self._config.get('gemini', {}).get('json_mode', True)
+    
+    @property
+    def gemini_batch_insights(self) -> bool:
+        """Check if fleet/destinations/future insights should share one API call when prefetched together"""
+        return self._config.get('gemini', {}).get('batch_insights', True)
+    
+    @property
+    def gemini_cache_only(self) -> bool:
+        """Check if only saved (e.g. precomputed) AI content should be served, with no live API calls"""
+        return self._config.get('gemini', {}).get('cache_only', False)
+    
+    @property
+    def gemini_deadline_seconds(self) -> float:
+        """Get total time budget for a generation, including queueing and retries"""
+        return self._config.get('gemini', {}).get('deadline_seconds', 45)
+    
+    @property
+    def circuit_failure_threshold(self) -> int:
+        """Get number of consecutive failures that opens the circuit breaker"""
+        return self._config.get('circuit_breaker', {}).get('failure_threshold', 5)
+    
+    @property
+    def circuit_recovery_seconds(self) -> float:
+        """Get how long the circuit stays open before a recovery probe is tried"""
+        return self._config.get('circuit_breaker', {}).get('recovery_seconds', 60)
+    
+    @property
+    def stream_responses(self) -> bool:
+        """Check if Gemini responses should be streamed and rendered item by item"""
+        return self._config.get('gemini', {}).get('stream', True)
+    
+    @property
+    def gemini_backend(self) -> str:
+        """Get the Gemini backend: live, record, replay or fake"""
+        # Environment variable overrides config.yaml (e.g. for benchmarks)
+        backend = os.environ.get('GEMINI_BACKEND') or self._config.get('gemini', {}).get('backend', 'live')
+        return backend if backend in GEMINI_BACKENDS else 'live'
+    
+    @property
+    def gemini_offline(self) -> bool:
+        """Check if the backend serves responses without calling the Gemini API"""
+        return self.gemini_backend in ('replay', 'fake')
+    
+    @property
+    def gemini_cassette_file(self) -> Path:
+        """Get the file recorded Gemini requests/responses are stored in"""
+        path = Path(self._config.get('gemini', {}).get('cassette_file', '.cache/gemini_cassette.jsonl'))
+        return path if path.is_absolute() else Path(__file__).parent.parent / path
+    
+    @property
+    def gemini_replay_latency(self) -> str:
+        """Get the latency replayed responses are served with: recorded or synthetic"""
+        return self._config.get('gemini', {}).get('replay_latency', 'recorded')
+    
+    @property
+    def gemini_replay_seed(self) -> int:
+        """Get the random seed for synthetic replay latencies"""
+        return self._config.get('gemini', {}).get('replay_seed', 0)
+    
+    @property
+    def gemini_synthetic_latency_ms(self) -> float:
+        """Get the median synthetic latency of fake (and synthetic replay) responses"""
+        return self._config.get('gemini', {}).get('synthetic_latency_ms', 1500)
+    
     @property
     def gemini_enabled(self) -> bool:
-        """Check if Gemini is globally enabled"""
-        return self._config.get('gemini', {}).get('enabled', False) and bool(self.gemini_api_key)
+        """Check if Gemini is globally enabled (offline backends need no API key)"""
+        return self._config.get('gemini', {}).get('enabled', False) and (bool(self.gemini_api_key) or self.gemini_offline)
     
     def is_ai_enabled_for(self, page: str) -> bool:
         """Check if AI enhancement is enabled for a specific page"""
@@ -95,6 +232,11 @@ class Config:
             return False
         return self._config.get('ai_enhancements', {}).get(page, False)
     
+    def ai_freshness_hours(self, page: str) -> float:
+        """Get how old a page's latest AI response may be before it is refreshed in the background"""
+        freshness = self._config.get('ai_freshness', {})
+        return freshness.get(page, freshness.get('default', 24))
+    
     @property
     def highlight_ai_content(self) -> bool:
         """Check if AI content should be highlighted"""
@@ -119,6 +261,136 @@ class Config:
     def cache_duration_hours(self) -> int:
         """Get cache duration in hours"""
         return self._config.get('cache', {}).get('duration_hours', 24)
+    
+    @property
+    def cache_max_size_mb(self) -> float:
+        """Get maximum size of the response cache database contents in MB"""
+        return self._config.get('cache', {}).get('max_size_mb', 50)
+    
+    @property
+    def cache_memory_max_mb(self) -> float:
+        """Get maximum size of the in-process response cache in MB"""
+        return self._config.get('cache', {}).get('memory_max_mb', 8)
+    
+    @property
+    def cache_history_retention(self) -> int:
+        """Get number of AI responses kept in each page's history"""
+        return self._config.get('cache', {}).get('history_retention', 5)
+    
+    @property
+    def cache_semantic_enabled(self) -> bool:
+        """Check if near-identical prompts may reuse a cached response"""
+        return self._config.get('cache', {}).get('semantic_enabled', False)
+    
+    @property
+    def cache_semantic_threshold(self) -> float:
+        """Get the minimum cosine similarity for a semantic cache hit"""
+        return self._config.get('cache', {}).get('semantic_threshold', 0.92)
+    
+    @property
+    def cache_semantic_max_entries(self) -> int:
+        """Get maximum number of prompts in the semantic cache index"""
+        return self._config.get('cache', {}).get('semantic_max_entries', 2000)
+    
+    @property
+    def rate_limit_requests_per_minute(self) -> float:
+        """Get maximum Gemini requests per minute for this process"""
+        return self._config.get('rate_limit', {}).get('requests_per_minute', 15)
+    
+    @property
+    def rate_limit_tokens_per_minute(self) -> float:
+        """Get maximum Gemini tokens (prompt + response) per minute for this process"""
+        return self._config.get('rate_limit', {}).get('tokens_per_minute', 250000)
+    
+    @property
+    def rate_limit_max_retries(self) -> int:
+        """Get number of retries for rate limited (429) or transient (5xx) Gemini errors"""
+        return self._config.get('rate_limit', {}).get('max_retries', 4)
+    
+    @property
+    def rate_limit_backoff_base_seconds(self) -> float:
+        """Get initial retry backoff delay in seconds (doubled on each attempt)"""
+        return self._config.get('rate_limit', {}).get('backoff_base_seconds', 1)
+    
+    @property
+    def rate_limit_backoff_max_seconds(self) -> float:
+        """Get maximum retry backoff delay in seconds"""
+        return self._config.get('rate_limit', {}).get('backoff_max_seconds', 30)
+    
+    @property
+    def prefetch_enabled(self) -> bool:
+        """Check if AI content should be prefetched in the background on app load"""
+        return self._config.get('prefetch', {}).get('enabled', True)
+    
+    @property
+    def prefetch_max_workers(self) -> int:
+        """Get maximum number of concurrent prefetch (background) requests"""
+        return self._config.get('prefetch', {}).get('max_workers', 3)
+    
+    @property
+    def jobs_max_workers(self) -> int:
+        """Get maximum number of AI generations requested from pages that run at once"""
+        return self._config.get('jobs', {}).get('max_workers', 4)
+    
+    @property
+    def jobs_aging_seconds(self) -> float:
+        """Get how long a queued AI job waits before it ranks one priority level higher"""
+        return self._config.get('jobs', {}).get('aging_seconds', 60)
+    
+    @property
+    def dictionary_topup_target_terms(self) -> int:
+        """Get how many new dictionary terms AI additions should reach through follow-up requests"""
+        return self._config.get('dictionary_topup', {}).get('target_terms', 15)
+    
+    @property
+    def dictionary_topup_max_requests(self) -> int:
+        """Get maximum number of Gemini requests per dictionary additions, including the first"""
+        return self._config.get('dictionary_topup', {}).get('max_requests', 3)
+    
+    @property
+    def precompute_max_workers(self) -> int:
+        """Get maximum number of concurrent requests made by the precompute CLI"""
+        return self._config.get('precompute', {}).get('max_workers', 3)
+    
+    @property
+    def precompute_bundle_file(self) -> Path:
+        """Get the precomputed AI content bundle imported at startup (if it exists)"""
+        path = Path(self._config.get('precompute', {}).get('bundle_file', 'ai_bundle.json.gz'))
+        return path if path.is_absolute() else Path(__file__).parent.parent / path
+    
+    @property
+    def metrics_enabled(self) -> bool:
+        """Check if Gemini calls should be recorded for the admin metrics page"""
+        return self._config.get('metrics', {}).get('enabled', True)
+    
+    @property
+    def metrics_window_size(self) -> int:
+        """Get number of recent calls kept in memory for latency percentiles"""
+        return self._config.get('metrics', {}).get('window_size', 1000)
+    
+    @property
+    def metrics_max_log_mb(self) -> float:
+        """Get size at which the JSONL call log is rotated, in MB"""
+        return self._config.get('metrics', {}).get('max_log_mb', 10)
+    
+    @property
+    def admin_password(self) -> str:
+        """Get password for the admin page (empty disables the page)"""
+        # Priority: Streamlit secrets > Environment variable > config file
+        try:
+            import streamlit as st
+            if hasattr(st, 'secrets') and 'admin' in st.secrets:
+                secret_password = st.secrets.get('admin', {}).get('password', '')
+                if secret_password:
+                    return secret_password
+        except:
+            pass
+        
+        env_password = os.environ.get('ADMIN_PASSWORD', '')
+        if env_password:
+            return env_password
+        
+        return self._config.get('admin', {}).get('password', '')
 
 
 # Singleton instance
@@ -0,0 +1,135 @@
+"""
+Static Datasets for THY Cadet Pilot Prep App
+Loads each dataset in data/ once per process and hands pages zero-copy, read-only views of it
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+import streamlit as st
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# Columnar data files: {"format_version": 1, "columns": {name: [values]}, "categories": {name: [labels]}},
+# where categorical columns hold indexes into their labels (label order is the column's sort order)
+COLUMNAR_FORMAT_VERSION = 1
+
+
+def _read(name: str) -> Any:
+    with open(DATA_DIR / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _decode(name: str, payload: Any) -> pd.DataFrame:
+    """Build a frame from a data file: plain records/columns, or the versioned columnar format"""
+    if not (isinstance(payload, dict) and 'format_version' in payload):
+        return pd.DataFrame(payload)
+    if payload['format_version'] != COLUMNAR_FORMAT_VERSION:
+        raise ValueError(f"{name}: unsupported format_version {payload['format_version']!r}")
+    categories = payload.get('categories', {})
+    return pd.DataFrame({
+        column: (
+            pd.Categorical.from_codes(values, categories=categories[column], ordered=True)
+            if column in categories else values
+        )
+        for column, values in payload['columns'].items()
+    })
+
+
+def _read_only(column: pd.Series) -> Any:
+    """A column's values in an array that can't be written to (a categorical's codes, for categoricals)"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy(copy=True)
+        codes.flags.writeable = False
+        return pd.Categorical.from_codes(codes, dtype=column.dtype)
+    values = column.to_numpy(copy=True)
+    values.flags.writeable = False
+    return values
+
+
+@st.cache_resource(show_spinner=False)
+def _load_frame(name: str) -> pd.DataFrame:
+    """Build a dataset's frame on first use, once per process, and share it across sessions and reruns
+
+    Its arrays are read-only, so an in-place write through any view raises instead of changing the
+    data every session sees.
+    """
+    frame = _decode(name, _read(name))
+    return pd.DataFrame({column: _read_only(frame[column]) for column in frame.columns}, copy=False)
+
+
+def _view(name: str) -> pd.DataFrame:
+    """A new frame object over the shared data, so pages can add, drop or replace columns of their own
+
+    Filtering, sorting and new columns make new arrays; the shared ones are never copied or modified.
+    """
+    return _load_frame(name).copy(deep=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_json(name: str) -> Any:
+    """Read a plain data file once per process"""
+    return _read(name)
+
+
+def dictionary() -> pd.DataFrame:
+    """Aviation dictionary terms (term, full_name, category, difficulty, definition)
+
+    category and difficulty are categoricals; difficulty is ordered Basic < Intermediate < Advanced.
+    """
+    return _view("dictionary.json")
+
+
+def fleet() -> pd.DataFrame:
+    """Turkish Airlines fleet by model, from THY Investor Relations (January 2026)
+
+    Source: https://investor.turkishairlines.com/en/financial-and-operational/fleet
+    """
+    return _view("fleet.json")
+
+
+def fleet_orders() -> pd.DataFrame:
+    """Turkish Airlines aircraft on order"""
+    return _view("fleet_orders.json")
+
+
+def destinations() -> pd.DataFrame:
+    """Turkish Airlines destinations by country (sample of major countries) with ISO codes for the map"""
+    return _view("destinations.json")
+
+
+def history() -> pd.DataFrame:
+    """Aviation history milestones (year, era, title, content), oldest first"""
+    return _view("history.json")
+
+
+def fleet_summary() -> str:
+    """Fleet summary the Fleet page gives Gemini as context for its insights"""
+    return _load_json("ai_context.json")['fleet_summary']
+
+
+def destinations_summary() -> str:
+    """Network summary the Destinations page gives Gemini as context for its insights"""
+    return _load_json("ai_context.json")['destinations_summary']
+
+
+def future_topics() -> List[str]:
+    """Topics the Future of Aviation page already covers, so Gemini suggests others"""
+    return list(_load_json("ai_context.json")['future_topics'])
+
+
+def ai_page_generators() -> Dict[str, Tuple[str, tuple]]:
+    """Generator method and arguments of every AI page, exactly as the page passes them to render_ai_section
+
+    Lets prefetch and precompute produce the same prompts (and cache keys) as the pages without a visit first.
+    """
+    return {
+        'dictionary': ('get_dictionary_additions', (dictionary()['term'].tolist(),)),
+        'news': ('get_news_updates', ()),
+        'history': ('get_history_additions', (history()['year'].tolist(),)),
+        'fleet': ('get_fleet_insights', (fleet_summary(),)),
+        'destinations': ('get_destinations_insights', (destinations_summary(),)),
+        'future': ('get_future_insights', (future_topics(),)),
+    }
@@ -0,0 +1,328 @@
+"""
+Dictionary Index for THY Cadet Pilot Prep App
+Ranked search, category/difficulty filters and sort orders over the aviation dictionary, built once per process
+"""
+
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import data
+from utils.term_store import normalize_term
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# BM25F: field weights (a hit in the abbreviation counts more than one in the definition) and saturation
+FIELD_WEIGHTS = {'term': 4.0, 'full_name': 2.0, 'definition': 1.0}
+K1 = 1.2
+B = 0.75
+
+# Abbreviation boosts outrank any text score, so "VOR" lists VOR before definitions mentioning it
+EXACT_TERM_BOOST = 1000.0
+TERM_PREFIX_BOOST = 100.0
+
+# Prefix expansions of queries this short match much of the vocabulary, so their merged postings are kept
+CACHED_PREFIX_LENGTH = 2
+
+# Sort orders for select(): name -> columns, most significant first (ties keep dataset order)
+SORT_ORDERS = {
+    'term': ['term'],
+    'term_desc': ['-term'],
+    'category': ['category', 'term'],
+    'difficulty': ['difficulty', 'term'],
+}
+
+# Typo correction: shortest word corrected, and word length from which two edits are allowed instead of one
+MIN_FUZZY_LENGTH = 3
+TWO_EDIT_LENGTH = 6
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into case-folded alphanumeric tokens"""
+    return [token.casefold() for token in TOKEN_PATTERN.findall(str(text))]
+
+
+def _trigrams(token: str, prefix: bool = False) -> List[str]:
+    """Character trigrams of a word marked at both ends (only at the start for a word still being typed)"""
+    padded = f"^{token}" if prefix else f"^{token}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _edit_distance(word: str, candidate: str, limit: int, prefix: bool = False) -> int:
+    """Edit distance with adjacent transpositions, or limit + 1 once it must exceed limit
+
+    With prefix, the distance to the closest prefix of candidate (word may be only partly typed).
+    Only cells within limit of the diagonal are computed; all others are already over the limit.
+    """
+    over = limit + 1
+    width = len(candidate) + 1
+    before, previous = None, [j if j <= limit else over for j in range(width)]
+    for i in range(1, len(word) + 1):
+        current = [over] * width
+        if i <= limit:
+            current[0] = i
+        for j in range(max(1, i - limit), min(width - 1, i + limit) + 1):
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (word[i - 1] != candidate[j - 1]))
+            if i > 1 and j > 1 and word[i - 1] == candidate[j - 2] and word[i - 2] == candidate[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return over
+        before, previous = previous, current
+    return min(min(previous) if prefix else previous[-1], over)
+
+
+def _bitset(mask: np.ndarray) -> np.ndarray:
+    """Pack a boolean mask over documents into a bitset (bit i of the array is document i)"""
+    return np.packbits(mask, bitorder='little')
+
+
+class _TrieNode:
+    __slots__ = ('children', 'docs')
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Every document whose key passes through this node, so a prefix lookup needs no subtree walk
+        self.docs: List[int] = []
+
+
+class DictionaryIndex:
+    """Inverted index (token -> postings with precomputed BM25F weights) plus a prefix trie of terms
+
+    Documents are row positions of the dictionary frame. Query tokens must all match (the last one
+    as a prefix, for search-as-you-type); abbreviations equal to or starting with the query get a
+    boost on top of the text score. A character-trigram index over the vocabulary proposes spelling
+    corrections for query words that match nothing (see suggest).
+
+    Filters and sorting (see select) use a bitset per category and difficulty and a permutation of
+    all documents per sort order, so they need no masks over or sorting of the frame.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        terms = df['term'].tolist()
+        self._size = len(terms)
+        self._term_keys = [normalize_term(term) for term in terms]
+        # Position of each document in alphabetical term order, the tie-break between equal scores
+        alphabetical = sorted(range(len(terms)), key=lambda doc: terms[doc].casefold())
+        self._alphabetical_rank = np.empty(len(terms), dtype=np.int64)
+        self._alphabetical_rank[alphabetical] = np.arange(len(terms))
+        self._postings: Dict[str, Dict[int, float]] = self._build_postings(
+            {'term': terms, 'full_name': df['full_name'].tolist(), 'definition': df['definition'].tolist()}
+        )
+        self._vocabulary = sorted(self._postings)
+        self._prefix_postings: Dict[str, Dict[int, float]] = {}
+
+        # Trigram -> vocabulary positions; each word is listed once per distinct trigram
+        self._trigram_index: Dict[str, List[int]] = defaultdict(list)
+        for position, token in enumerate(self._vocabulary):
+            for trigram in set(_trigrams(token)) | set(_trigrams(token, prefix=True)):
+                self._trigram_index[trigram].append(position)
+
+        self._trie = _TrieNode()
+        for doc, key in enumerate(self._term_keys):
+            node = self._trie
+            for char in key:
+                node = node.children.setdefault(char, _TrieNode())
+                node.docs.append(doc)
+
+        # Sort keys as integer ranks: case-sensitive term order (as sort_values) and category label order
+        sort_keys = {'term': np.unique(np.asarray(terms, dtype=object), return_inverse=True)[1].astype(np.int64)}
+        self._bits: Dict[str, Dict[str, np.ndarray]] = {}
+        for column in ('category', 'difficulty'):
+            values = df[column].astype('category')
+            codes = values.cat.codes.to_numpy()
+            sort_keys[column] = codes.astype(np.int64)
+            self._bits[column] = {
+                str(label): _bitset(codes == code) for code, label in enumerate(values.cat.categories)
+            }
+        sort_keys['-term'] = -sort_keys['term']
+        # np.lexsort is stable and takes the most significant key last
+        self._orders = {
+            name: np.lexsort([sort_keys[column] for column in reversed(columns)])
+            for name, columns in SORT_ORDERS.items()
+        }
+        self._all_bits = _bitset(np.ones(self._size, dtype=bool))
+        self._no_bits = np.zeros_like(self._all_bits)
+
+    @staticmethod
+    def _build_postings(fields: Dict[str, Sequence[str]]) -> Dict[str, Dict[int, float]]:
+        """Tokenize every field and turn term frequencies into final BM25F weights"""
+        n_docs = len(fields['term'])
+        tokens = {name: [tokenize(text) for text in texts] for name, texts in fields.items()}
+        avg_len = {name: (sum(map(len, docs)) / n_docs if n_docs else 0) or 1 for name, docs in tokens.items()}
+
+        # Length-normalized, weighted term frequency summed over fields
+        weighted_tf: Dict[str, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for name, docs in tokens.items():
+            weight = FIELD_WEIGHTS[name]
+            for doc, doc_tokens in enumerate(docs):
+                norm = 1 - B + B * len(doc_tokens) / avg_len[name]
+                for token in doc_tokens:
+                    weighted_tf[token][doc] += weight / norm
+
+        postings = {}
+        for token, docs in weighted_tf.items():
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            postings[token] = {doc: idf * tf / (K1 + tf) for doc, tf in docs.items()}
+        return postings
+
+    def _expand_prefix(self, prefix: str) -> Dict[int, float]:
+        """Postings of every vocabulary token starting with prefix (best weight per document)"""
+        cached = self._prefix_postings.get(prefix)
+        if cached is not None:
+            return cached
+        merged: Dict[int, float] = {}
+        start = bisect_left(self._vocabulary, prefix)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            for doc, weight in self._postings[token].items():
+                if weight > merged.get(doc, 0.0):
+                    merged[doc] = weight
+        if len(prefix) <= CACHED_PREFIX_LENGTH:
+            self._prefix_postings[prefix] = merged
+        return merged
+
+    def _term_prefix_docs(self, key: str) -> List[int]:
+        """Documents whose normalized term starts with key"""
+        node = self._trie
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.docs
+
+    def _correct(self, word: str, prefix: bool) -> Optional[str]:
+        """Closest vocabulary word to a misspelled one, preferring words that occur in more documents
+
+        Candidates must be close in length and share enough trigrams with word to be within the edit
+        limit; only they are verified with the bounded edit distance.
+        """
+        if len(word) < MIN_FUZZY_LENGTH:
+            return None
+        limit = 2 if len(word) >= TWO_EDIT_LENGTH else 1
+        trigrams = set(_trigrams(word, prefix))
+        shared = Counter()
+        for trigram in trigrams:
+            shared.update(self._trigram_index.get(trigram, ()))
+
+        best, best_key = None, None
+        for position, count in shared.items():
+            candidate = self._vocabulary[position]
+            if prefix:
+                if len(candidate) < len(word) - limit or count < len(trigrams) - 3 * limit:
+                    continue
+            # A whole word has as many trigrams as letters, and each edit changes at most three of them
+            elif abs(len(candidate) - len(word)) > limit or count < max(len(word), len(candidate)) - 3 * limit:
+                continue
+            distance = _edit_distance(word, candidate, limit, prefix)
+            if distance > limit:
+                continue
+            key = (distance, -len(self._postings[candidate]), candidate)
+            if best_key is None or key < best_key:
+                best, best_key = candidate, key
+        return best
+
+    def suggest(self, query: str) -> Optional[str]:
+        """Query with every word that matches nothing replaced by its closest spelling, or None"""
+        tokens = tokenize(query)
+        corrections = {}
+        for i, token in enumerate(tokens):
+            prefix = i == len(tokens) - 1
+            if (self._expand_prefix(token) if prefix else self._postings.get(token)) or token in corrections:
+                continue
+            # A finished but misspelled last word is likelier than a misspelled start of a longer one
+            correction = self._correct(token, False) or (self._correct(token, True) if prefix else None)
+            if correction is not None:
+                corrections[token] = correction
+        if not corrections:
+            return None
+
+        def replace(match):
+            word = match.group(0)
+            correction = corrections.get(word.casefold())
+            if correction is None:
+                return word
+            return correction.upper() if word.isupper() else correction
+
+        return TOKEN_PATTERN.sub(replace, query)
+
+    def search(self, query: str) -> List[int]:
+        """Get the documents matching query, best first"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        # Last token is still being typed, so it matches as a prefix; the rest must match exactly
+        token_postings = [self._postings.get(token, {}) for token in tokens[:-1]]
+        token_postings.append(self._expand_prefix(tokens[-1]))
+        token_postings.sort(key=len)
+
+        scores: Dict[int, float] = {}
+        if len(token_postings) == 1:
+            scores = dict(token_postings[0])
+        elif token_postings[0]:
+            for doc, weight in token_postings[0].items():
+                total = weight
+                for postings in token_postings[1:]:
+                    other = postings.get(doc)
+                    if other is None:
+                        break
+                    total += other
+                else:
+                    scores[doc] = total
+
+        key = normalize_term(query)
+        for doc in self._term_prefix_docs(key):
+            term_key = self._term_keys[doc]
+            boost = EXACT_TERM_BOOST if term_key == key else TERM_PREFIX_BOOST * len(key) / len(term_key)
+            scores[doc] = scores.get(doc, 0.0) + boost
+
+        if not scores:
+            return []
+        docs = np.fromiter(scores.keys(), dtype=np.int64, count=len(scores))
+        values = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        return docs[np.lexsort((self._alphabetical_rank[docs], -values))].tolist()
+
+    def count(self, column: str, value: str) -> int:
+        """Number of documents whose category or difficulty is value"""
+        bits = self._bits[column].get(value, self._no_bits)
+        return int(np.unpackbits(bits, count=self._size, bitorder='little').sum())
+
+    def select(self, category: Optional[str] = None, difficulty: Optional[str] = None,
+               order: Optional[str] = 'term', docs: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Get the positions of the documents passing the filters, in the given order
+
+        category and difficulty filter on a label (None for all). order is a SORT_ORDERS name, or None
+        to keep the order of docs (e.g. search results by relevance). docs limits the result to those
+        documents, typically search results.
+        """
+        bits = self._all_bits
+        if category is not None:
+            bits = bits & self._bits['category'].get(category, self._no_bits)
+        if difficulty is not None:
+            bits = bits & self._bits['difficulty'].get(difficulty, self._no_bits)
+        if docs is not None:
+            docs = np.asarray(docs, dtype=np.int64)
+            if order is not None:
+                found = np.zeros(self._size, dtype=bool)
+                found[docs] = True
+                bits = bits & _bitset(found)
+        mask = np.unpackbits(bits, count=self._size, bitorder='little').view(bool)
+
+        if order is None:
+            return docs[mask[docs]] if docs is not None else np.flatnonzero(mask)
+        permutation = self._orders[order]
+        return permutation[mask[permutation]]
+
+
+@st.cache_resource(show_spinner=False)
+def dictionary_index() -> DictionaryIndex:
+    """Build the dictionary index once per process and share it across sessions and reruns"""
+    return DictionaryIndex(data.dictionary())
@@ -0,0 +1,264 @@
+"""
+Gemini Backends for THY Cadet Pilot Prep App
+Record/replay cassettes and a fake model so the AI layer can be benchmarked offline
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.config import config
+from utils.response_schemas import RESPONSE_SCHEMAS
+
+# Size of the pieces a replayed/fake response is streamed in when no recorded chunks exist
+STREAM_CHUNK_CHARS = 80
+
+_FAKE_WORDS = (
+    "aircraft runway approach cockpit crew airline fleet route captain pilot cadet interview "
+    "navigation weather altitude clearance procedure safety training simulator turbine wing "
+    "fuel efficiency hub network passenger cargo system checklist landing departure"
+).split()
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was never recorded"""
+
+
+def request_key(prompt: str, generation_config: Optional[Dict[str, Any]]) -> str:
+    """Stable key identifying a request in a cassette"""
+    payload = json.dumps({'prompt': prompt, 'generation_config': generation_config}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _usage(prompt_tokens: int, response_tokens: int) -> SimpleNamespace:
+    """Usage metadata shaped like the API's"""
+    return SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=response_tokens,
+                           total_token_count=prompt_tokens + response_tokens)
+
+
+def synthetic_latency(rng: random.Random) -> float:
+    """Seconds drawn from a log-normal distribution with median gemini.synthetic_latency_ms"""
+    median_ms = config.gemini_synthetic_latency_ms
+    if median_ms <= 0:
+        return 0.0
+    return rng.lognormvariate(0, 0.5) * median_ms / 1000.0
+
+
+class SimulatedResponse:
+    """Response with the same surface as the API's: .text, .usage_metadata and, when streamed, chunks
+
+    Iterating yields the chunks with their delays, so streaming callers see realistic pacing;
+    non-streamed responses have already waited for the total latency.
+    """
+
+    def __init__(self, chunks: List[str], delays: List[float], usage: SimpleNamespace, stream: bool):
+        self._chunks = chunks
+        self._delays = delays
+        self.usage_metadata = usage
+        self.text = ''.join(chunks)
+        if not stream:
+            time.sleep(sum(delays))
+
+    def __iter__(self) -> Iterator[SimpleNamespace]:
+        for chunk, delay in zip(self._chunks, self._delays):
+            time.sleep(delay)
+            yield SimpleNamespace(text=chunk)
+
+
+def _page_schema(page_name: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Response schema of a page, or a keyed object of them for a batch of pages ('fleet+destinations')"""
+    if not page_name:
+        return None
+    pages = page_name.split('+')
+    if len(pages) > 1 and all(page in RESPONSE_SCHEMAS for page in pages):
+        return {'type': 'object', 'properties': {page: RESPONSE_SCHEMAS[page] for page in pages}}
+    return RESPONSE_SCHEMAS.get(page_name)
+
+
+def _split(text: str) -> List[str]:
+    return [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)] or ['']
+
+
+def _spread(total: float, count: int) -> List[float]:
+    """Spread a latency over chunks, most of it before the first one (time to first token)"""
+    if count == 1:
+        return [total]
+    first = total * 0.5
+    return [first] + [(total - first) / (count - 1)] * (count - 1)
+
+
+class Cassette:
+    """Append-only JSONL file of recorded request/response pairs"""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._replayed: Dict[str, int] = {}
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Index recorded entries by request key (must hold the lock)"""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self._path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        self._entries.setdefault(entry['key'], []).append(entry)
+            except FileNotFoundError:
+                pass
+        return self._entries
+
+    def append(self, entry: Dict[str, Any]):
+        """Record a request/response pair"""
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+            if self._entries is not None:
+                self._entries.setdefault(entry['key'], []).append(entry)
+
+    def next_entry(self, key: str) -> Dict[str, Any]:
+        """Get the recording for a request, cycling through repeated recordings in order"""
+        with self._lock:
+            entries = self._load().get(key)
+            if not entries:
+                raise CassetteMissError("No recorded Gemini response for this request. "
+                                        "Record one first with gemini.backend: record.")
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+            return entries[index % len(entries)]
+
+
+class RecordingStream:
+    """Passes a live streamed response through, timing each chunk; on_complete gets (chunks, delays)"""
+
+    def __init__(self, response, start: float, on_complete):
+        self._response = response
+        self._start = start
+        self._on_complete = on_complete
+
+    def __iter__(self):
+        chunks, delays = [], []
+        last = self._start
+        for chunk in self._response:
+            now = time.perf_counter()
+            chunks.append(chunk.text)
+            delays.append(now - last)
+            last = now
+            yield chunk
+        self._on_complete(chunks, delays)
+
+    @property
+    def usage_metadata(self):
+        return getattr(self._response, 'usage_metadata', None)
+
+
+class RecordingModel:
+    """Wraps a live GenerativeModel and writes every request/response pair to a cassette"""
+
+    def __init__(self, model, cassette: Cassette, model_name: str):
+        self._model = model
+        self._cassette = cassette
+        self._model_name = model_name
+
+    def generate_content(self, prompt: str, stream: bool = False, generation_config=None, request_options=None):
+        start = time.perf_counter()
+        response = self._model.generate_content(prompt, stream=stream, generation_config=generation_config,
+                                                request_options=request_options)
+        if not stream:
+            self._record(prompt, generation_config, [response.text], [time.perf_counter() - start], response)
+            return response
+        return RecordingStream(response, start, lambda chunks, delays: self._record(
+            prompt, generation_config, chunks, delays, response))
+
+    def _record(self, prompt: str, generation_config, chunks: List[str], delays: List[float], response):
+        usage = getattr(response, 'usage_metadata', None)
+        self._cassette.append({
+            'key': request_key(prompt, generation_config),
+            'recorded_at': time.time(),
+            'model': self._model_name,
+            'prompt': prompt,
+            'generation_config': generation_config,
+            'chunks': chunks,
+            'delays': [round(d, 4) for d in delays],
+            'prompt_tokens': getattr(usage, 'prompt_token_count', 0),
+            'response_tokens': getattr(usage, 'candidates_token_count', 0),
+        })
+
+
+class ReplayModel:
+    """Serves recorded responses deterministically, with recorded or synthetic latency"""
+
+    def __init__(self, cassette: Cassette):
+        self._cassette = cassette
+        self._rng = random.Random(config.gemini_replay_seed)
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt: str, stream: bool = False, generation_config=None, request_options=None,
+                         page_name: Optional[str] = None):
+        entry = self._cassette.next_entry(request_key(prompt, generation_config))
+        chunks = entry['chunks'] if stream else [''.join(entry['chunks'])]
+        if config.gemini_replay_latency == 'recorded':
+            delays = entry['delays'] if stream else [sum(entry['delays'])]
+        else:
+            with self._lock:
+                delays = _spread(synthetic_latency(self._rng), len(chunks))
+        return SimulatedResponse(chunks, delays, _usage(entry['prompt_tokens'], entry['response_tokens']), stream)
+
+
+class FakeModel:
+    """Returns generated data matching the page's response schema, without any API call
+
+    The schema comes from the request (JSON mode) or else from the page the request is for, so pages
+    get parseable JSON with gemini.json_mode off too. The data is seeded from the prompt, so the same
+    request always gets the same response.
+    """
+
+    def generate_content(self, prompt: str, stream: bool = False, generation_config=None, request_options=None,
+                         page_name: Optional[str] = None):
+        rng = random.Random(request_key(prompt, generation_config))
+        schema = (generation_config or {}).get('response_schema') or _page_schema(page_name)
+        if schema is not None:
+            text = json.dumps(self._generate(schema, rng), indent=2)
+        else:
+            text = self._words(rng, 40)
+        chunks = _split(text) if stream else [text]
+        delays = _spread(synthetic_latency(rng), len(chunks))
+        return SimulatedResponse(chunks, delays, _usage(len(prompt) // 4, len(text) // 4), stream)
+
+    def _generate(self, schema: Dict[str, Any], rng: random.Random, name: str = '') -> Any:
+        """Generate a value for a (subset of OpenAPI) schema"""
+        kind = schema.get('type')
+        if kind == 'array':
+            return [self._generate(schema['items'], rng, name) for _ in range(rng.randint(3, 5))]
+        if kind == 'object':
+            return {key: self._generate(value, rng, key) for key, value in schema.get('properties', {}).items()}
+        if kind == 'integer':
+            return rng.randint(1903, 2030) if name == 'year' else rng.randint(1, 100)
+        if kind == 'number':
+            return round(rng.uniform(0, 100), 2)
+        if kind == 'boolean':
+            return rng.random() < 0.5
+        if name in ('term', 'title', 'full_name', 'category', 'era', 'difficulty', 'timeline', 'date'):
+            return self._words(rng, 3).rstrip('.').title()
+        return self._words(rng, 25)
+
+    @staticmethod
+    def _words(rng: random.Random, count: int) -> str:
+        return ' '.join(rng.choice(_FAKE_WORDS) for _ in range(count)).capitalize() + '.'
+
+
+def create_offline_model(backend: str, cassette: Cassette):
+    """Create the model for an offline backend ('replay' or 'fake')"""
+    if backend == 'replay':
+        return ReplayModel(cassette)
+    return FakeModel()
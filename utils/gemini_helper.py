@@ -4,10 +4,15 @@ Handles all Gemini API interactions and content generation
 """
 
 import json
+import os
+import re
+import threading
+import time
 import hashlib
 from datetime import datetime, timedelta
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Callable
 import streamlit as st
 
 try:
@@ -17,26 +22,184 @@ except ImportError:
     GEMINI_AVAILABLE = False
 
 from utils.config import config
+from utils.cache_store import ResponseCache, MemoryCache, TieredCache
+from utils.history_store import HistoryStore
+from utils.term_store import AITermStore, normalize_term
+from utils.singleflight import SingleFlight
+from utils.json_parser import JSONArrayStreamParser, salvage_json_array, salvage_json_sections
+from utils.response_schemas import RESPONSE_SCHEMAS, validate_items
+from utils.prefetch import prefetch
+from utils.precompute import load_bundle_at_boot
+from utils.jobs import jobs, INTERACTIVE
+from utils.rate_limit import rate_limiter, call_with_retry, QueueTimeoutError
+from utils.circuit_breaker import circuit_breaker, CircuitOpenError
+from utils.metrics import metrics
+from utils.gemini_backends import Cassette, RecordingModel, create_offline_model
+from utils.semantic_cache import SemanticCache
+
+# Rough response size used to reserve tokens/min quota before a call (reconciled afterwards)
+ESTIMATED_RESPONSE_TOKENS = 1000
+
+# Legacy one-file-per-key cache entries ({md5}.json)
+LEGACY_CACHE_FILE = re.compile(r"^[0-9a-f]{32}\.json$")
+
+# How long a process waits before checking again whether it may refresh a stale page another process refreshed
+REFRESH_CLAIM_RECHECK_SECONDS = 60
+
+
+class GenerationError(Exception):
+    """Raised when a generation fails, with a message for the user
+
+    Generations run on job worker threads, which can't write to the page, so the page that
+    waits for the job shows the message (as st.error or st.warning, per level) instead.
+    """
+
+    def __init__(self, message: str, level: str = 'error'):
+        super().__init__(message)
+        self.level = level
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so formatting-only edits don't change cache keys"""
+    return ' '.join(text.split())
+
+
+def _canonical_inputs(value: Any) -> Any:
+    """Normalize prompt inputs for hashing: trimmed whitespace, and lists as sorted unique values"""
+    if isinstance(value, str):
+        return _normalize_text(value)
+    if isinstance(value, (list, tuple, set)):
+        items = [_canonical_inputs(v) for v in value]
+        if isinstance(value, tuple):
+            # Positional arguments keep their order
+            return items
+        return sorted({json.dumps(item, sort_keys=True) for item in items})
+    return value
+
+
+def _semantic_inputs(args: tuple) -> List[str]:
+    """One normalized text per prompt argument, for the semantic cache"""
+    return [json.dumps(_canonical_inputs(arg)) for arg in args]
+
+
+@st.cache_resource(show_spinner=False)
+def _load_generative_model(model_name: str, api_key: str):
+    """Create a GenerativeModel once per process and share it across sessions and reruns"""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
 
 
 class GeminiHelper:
     """Helper class for Gemini API interactions"""
     
+    # Insight pages that can share one API call (see get_insights_batch): page -> (generator, prompt builder)
+    BATCHABLE_INSIGHTS = {
+        'fleet': ('get_fleet_insights', '_fleet_insights_prompt'),
+        'destinations': ('get_destinations_insights', '_destinations_insights_prompt'),
+        'future': ('get_future_insights', '_future_insights_prompt'),
+    }
+    
     def __init__(self):
         self._model = None
+        self._model_name: Optional[str] = None
+        # Why the model could not be created, for the error message of the calls that need it
+        self._model_error: Optional[str] = None
         self._cache_dir = Path(__file__).parent.parent / ".cache"
         self._cache_dir.mkdir(exist_ok=True)
+        # Shared by every session in the process since gemini is a module-level singleton
+        self._response_cache = TieredCache(
+            memory=MemoryCache(max_bytes=int(config.cache_memory_max_mb * 1024 * 1024)),
+            disk=ResponseCache(
+                self._cache_dir / "responses.db",
+                max_bytes=int(config.cache_max_size_mb * 1024 * 1024)
+            )
+        )
+        self._migrate_legacy_cache()
+        # (namespace, builder, json mode) -> template version, see _get_template_key
+        self._template_versions: Dict[Tuple[str, str, bool], str] = {}
+        self._history = HistoryStore(self._cache_dir / "responses.db", retention=config.cache_history_retention)
+        # Every dictionary term Gemini has suggested, so later additions only bring new ones
+        self._ai_terms = AITermStore(self._cache_dir / "responses.db")
+        self._imported_history = set()
+        # Page -> monotonic time before which a stale page is not checked for a background refresh again
+        self._refresh_backoff: Dict[str, float] = {}
+        # Identical concurrent requests (same cache key) share one API call
+        self._inflight = SingleFlight()
+        # Malformed JSON responses recovered by salvage_json_array, for the sidebar stats
+        self._salvage_lock = threading.Lock()
+        self._salvaged_responses = 0
+        self._salvaged_items = 0
+        # Request/response recordings for the record and replay backends
+        self._cassette = Cassette(config.gemini_cassette_file)
+        # Near-identical prompt inputs -> exact cache keys (cache.semantic_enabled)
+        self._semantic = SemanticCache(config.cache_semantic_threshold, config.cache_semantic_max_entries)
+    
+    def _migrate_legacy_cache(self):
+        """Import legacy {md5}.json cache files into the response cache and delete them"""
+        ttl_seconds = config.cache_duration_hours * 3600
+        for cache_file in self._cache_dir.glob("*.json"):
+            if not LEGACY_CACHE_FILE.match(cache_file.name):
+                continue
+            try:
+                with open(cache_file, 'r') as f:
+                    cached = json.load(f)
+                created_at = datetime.fromisoformat(cached['timestamp']).timestamp()
+                self._response_cache.disk.put(cache_file.stem, cached['response'], ttl_seconds, created_at=created_at)
+            except (json.JSONDecodeError, KeyError, ValueError, IOError):
+                pass
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
     
     @property
     def is_available(self) -> bool:
         """Check if Gemini is available and configured"""
-        return GEMINI_AVAILABLE and config.gemini_enabled
+        return (GEMINI_AVAILABLE or config.gemini_offline) and config.gemini_enabled
+    
+    def _get_models_file(self) -> Path:
+        """Get the file the model catalogue and selection are persisted in"""
+        return self._cache_dir / "models.json"
+    
+    def _load_models_file(self) -> Dict[str, Any]:
+        """Load the persisted model catalogue for the current API key"""
+        try:
+            with open(self._get_models_file(), 'r') as f:
+                saved = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        # A different API key may have access to different models
+        if saved.get('api_key_hash') != hashlib.md5(config.gemini_api_key.encode()).hexdigest():
+            return {}
+        return saved
+    
+    def _save_models_file(self, **updates):
+        """Persist model catalogue/selection fields atomically"""
+        saved = self._load_models_file()
+        saved.update(updates)
+        saved['api_key_hash'] = hashlib.md5(config.gemini_api_key.encode()).hexdigest()
+        models_file = self._get_models_file()
+        tmp_file = models_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(saved, f)
+            os.replace(tmp_file, models_file)
+        except (IOError, OSError):
+            pass
     
     def _get_available_models(self) -> List[str]:
-        """Get list of available Gemini models that support content generation"""
+        """Get list of available Gemini models that support content generation
+        
+        The catalogue is persisted to disk for gemini.model_list_ttl_hours, so new processes
+        don't need the list_models() round trip.
+        """
         if not self.is_available:
             return []
         
+        saved = self._load_models_file()
+        if saved.get('models') and time.time() - saved.get('listed_at', 0) < config.gemini_model_list_ttl_hours * 3600:
+            return saved['models']
+        
         try:
             genai.configure(api_key=config.gemini_api_key)
             available = []
@@ -46,192 +209,530 @@ class GeminiHelper:
                     clean_name = model.name.replace("models/", "")
                     if 'gemini' in clean_name.lower():
                         available.append(clean_name)
-            return sorted(available)
+            available = sorted(available)
+            if available:
+                self._save_models_file(models=available, listed_at=time.time())
+            return available
         except Exception:
             return []
     
-    def _get_model(self):
-        """Get or create Gemini model instance, with user selection if preferred model unavailable"""
-        if self._model is None and self.is_available:
-            genai.configure(api_key=config.gemini_api_key)
-            
-            # Get available models
+    def _resolve_model_name(self) -> Optional[str]:
+        """Resolve which model to use without any UI: the preferred model, or a previous selection"""
+        if self._model_name is None and config.gemini_offline:
+            # Offline backends don't talk to the API, so there is no catalogue to check against
+            self._model_name = config.gemini_model
+        if self._model_name is None:
             available_models = self._get_available_models()
-            
-            if not available_models:
-                st.error("❌ No Gemini models available for your API key. Check your API key permissions.")
-                return None
-            
-            # Check if preferred model from config is available
             preferred_model = config.gemini_model
-            
-            # Initialize session state for model selection
-            if 'selected_gemini_model' not in st.session_state:
-                st.session_state.selected_gemini_model = None
+            selected_model = self._load_models_file().get('selected')
             
             if preferred_model in available_models:
-                # Preferred model is available, use it
-                selected_model = preferred_model
-            elif st.session_state.selected_gemini_model and st.session_state.selected_gemini_model in available_models:
-                # User has already selected a model
-                selected_model = st.session_state.selected_gemini_model
-            else:
-                # Preferred model not available, show warning and let user select
-                st.warning(f"⚠️ Preferred model '{preferred_model}' is not available.")
-                
-                # Show available models for user to select
-                st.markdown("**Select an available model:**")
-                selected_model = st.selectbox(
-                    "Available Gemini Models",
-                    options=available_models,
-                    key="gemini_model_selector",
-                    help="Select a model to use for AI features"
-                )
-                
-                if st.button("✅ Use Selected Model", key="confirm_model"):
-                    st.session_state.selected_gemini_model = selected_model
-                    st.rerun()
-                
-                # Don't proceed until user confirms
-                if not st.session_state.selected_gemini_model:
-                    return None
-                
-                selected_model = st.session_state.selected_gemini_model
+                self._model_name = preferred_model
+            elif selected_model in available_models:
+                self._model_name = selected_model
+        return self._model_name
+    
+    def _select_model(self, model_name: str):
+        """Use model_name for the whole process and remember it for future processes"""
+        self._model_name = model_name
+        self._save_models_file(selected=model_name)
+    
+    def _render_model_selector(self) -> Optional[str]:
+        """Let the user pick a model when the preferred one is unavailable"""
+        available_models = self._get_available_models()
+        
+        if not available_models:
+            st.error("❌ No Gemini models available for your API key. Check your API key permissions.")
+            return None
+        
+        # Preferred model not available, show warning and let user select
+        st.warning(f"⚠️ Preferred model '{config.gemini_model}' is not available.")
+        
+        # Show available models for user to select
+        st.markdown("**Select an available model:**")
+        selected_model = st.selectbox(
+            "Available Gemini Models",
+            options=available_models,
+            key="gemini_model_selector",
+            help="Select a model to use for AI features"
+        )
+        
+        if st.button("✅ Use Selected Model", key="confirm_model"):
+            self._select_model(selected_model)
+            st.rerun()
+        
+        # Don't proceed until user confirms
+        return None
+    
+    def _get_model(self):
+        """Get or create the Gemini model instance without any UI (None if no model is usable)
+
+        Safe on any thread; see _get_model_interactive for the script thread.
+        """
+        if self._model is None and self.is_available:
+            selected_model = self._resolve_model_name()
+            if selected_model is None:
+                return None
+            
+            backend = config.gemini_backend
+            if backend in ('replay', 'fake'):
+                self._model = create_offline_model(backend, self._cassette)
+                return self._model
             
             try:
-                self._model = genai.GenerativeModel(selected_model)
-                st.toast(f"✅ Connected to {selected_model}")
+                model = _load_generative_model(selected_model, config.gemini_api_key)
+                if backend == 'record':
+                    model = RecordingModel(model, self._cassette, selected_model)
+                self._model = model
+                self._model_error = None
             except Exception as e:
-                st.error(f"Failed to initialize model {selected_model}: {str(e)}")
+                self._model_error = f"Failed to initialize model {selected_model}: {str(e)}"
                 return None
         
         return self._model
     
+    def _get_model_interactive(self):
+        """Get or create the model from a page's script thread, with user selection if preferred model unavailable"""
+        if self._model is None and self.is_available:
+            if self._resolve_model_name() is None:
+                return self._render_model_selector()
+            if self._get_model() is None:
+                st.error(self._model_error)
+                return None
+            if not config.gemini_offline:
+                st.toast(f"✅ Connected to {self._model_name}")
+        return self._model
+    
     def _get_page_cache_file(self, page_name: str) -> Path:
-        """Get the cache file path for a specific page"""
+        """Get the legacy cache file path for a specific page"""
         return self._cache_dir / f"history_{page_name}.json"
     
-    def _load_page_cache(self, page_name: str) -> List[Dict[str, Any]]:
-        """Load cache history for a page"""
-        cache_file = self._get_page_cache_file(page_name)
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return []
-        return []
+    def _ensure_page_history(self, page_name: str):
+        """Import the legacy history_{page}.json file into the history store once per process"""
+        if page_name not in self._imported_history:
+            self._history.import_legacy(page_name, self._get_page_cache_file(page_name))
+            self._imported_history.add(page_name)
+    
+    def _load_page_cache(self, page_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Load cache history for a page (newest first)"""
+        self._ensure_page_history(page_name)
+        return self._history.latest(page_name, limit)
     
     def _save_to_page_cache(self, page_name: str, response_data: Any):
-        """Save response to page cache history (keeps last 5)"""
-        cache_file = self._get_page_cache_file(page_name)
-        history = self._load_page_cache(page_name)
-        
-        # Add new entry
-        entry = {
-            'timestamp': datetime.now().isoformat(),
-            'data': response_data
-        }
-        history.insert(0, entry)  # Add to front
-        
-        # Keep only last 5
-        history = history[:5]
-        
-        with open(cache_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        """Append response to page cache history (keeps the last cache.history_retention entries)"""
+        self._ensure_page_history(page_name)
+        self._history.append(page_name, response_data)
+    
+    def get_cache_history(self, page_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get cache history for a page, newest first (public method)"""
+        return self._load_page_cache(page_name, limit)
     
-    def get_cache_history(self, page_name: str) -> List[Dict[str, Any]]:
-        """Get cache history for a page (public method)"""
-        return self._load_page_cache(page_name)
+    def claim_refresh(self, page_name: str) -> bool:
+        """Claim a stale page's background refresh; at most one per ai_freshness window across all processes"""
+        now = time.monotonic()
+        if self._refresh_backoff.get(page_name, 0) > now:
+            return False
+        hours = config.ai_freshness_hours(page_name)
+        claimed = self._history.claim_refresh(page_name, hours)
+        # Another process may hold the claim; ask the database again after a while instead of every rerun
+        self._refresh_backoff[page_name] = now + (hours * 3600 if claimed else REFRESH_CLAIM_RECHECK_SECONDS)
+        return claimed
+    
+    def get_cache_history_count(self, page_name: str) -> int:
+        """Get the number of saved responses for a page"""
+        self._ensure_page_history(page_name)
+        return self._history.count(page_name)
     
     def _get_cache_key(self, prompt: str, context: str = "") -> str:
-        """Generate cache key from prompt and context"""
-        content = f"{prompt}:{context}"
+        """Generate cache key from prompt and context (whitespace-insensitive)"""
+        content = f"{_normalize_text(prompt)}:{_normalize_text(context)}"
         return hashlib.md5(content.encode()).hexdigest()
     
-    def _get_cached_response(self, cache_key: str) -> Optional[str]:
-        """Get cached response if available and not expired"""
-        if not config.cache_enabled:
-            return None
+    def _get_template_key(self, namespace: str, builder: Callable[..., Tuple[str, str]], args: tuple) -> str:
+        """Build a stable cache key for a prompt template rendered with args
         
-        cache_file = self._cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    cached = json.load(f)
-                
-                cached_time = datetime.fromisoformat(cached['timestamp'])
-                if datetime.now() - cached_time < timedelta(hours=config.cache_duration_hours):
-                    return cached['response']
-            except (json.JSONDecodeError, KeyError):
-                pass
+        The key is {namespace}/g{generation}/{template id}/{template version}/{content digest}:
+        the template version hashes the builder's text (rendered with empty inputs) and the page's
+        response schema, and the content digest hashes the normalized inputs. Whitespace or ordering
+        changes to the inputs keep the key, and invalidate_cache(namespace) changes it for every entry.
+        """
+        schema = RESPONSE_SCHEMAS.get(namespace) if config.gemini_json_mode else None
+        version_key = (namespace, builder.__name__, schema is not None)
+        template_version = self._template_versions.get(version_key)
+        if template_version is None:
+            # The template text is code, so its version only needs computing once per process
+            template = builder(*(type(arg)() for arg in args))
+            template_version = hashlib.md5(
+                json.dumps([_normalize_text(part) for part in template] + [schema], sort_keys=True).encode()
+            ).hexdigest()[:12]
+            self._template_versions[version_key] = template_version
+        content_digest = hashlib.md5(
+            json.dumps(_canonical_inputs(args), sort_keys=True).encode()
+        ).hexdigest()[:16]
+        generation = self._response_cache.generation(namespace)
+        template_id = builder.__name__.strip('_')
+        return f"{namespace}/g{generation}/{template_id}/{template_version}/{content_digest}"
+    
+    def _localize_template_key(self, cache_key: str) -> str:
+        """Rewrite a template key from another deployment to this deployment's namespace generation"""
+        parts = cache_key.split('/')
+        if len(parts) != 5 or not parts[1].startswith('g'):
+            return cache_key
+        parts[1] = f"g{self._response_cache.generation(parts[0])}"
+        return '/'.join(parts)
+    
+    def invalidate_cache(self, namespace: str) -> int:
+        """Make every cached response in a namespace (page) unreachable in O(1); returns the new generation
         
-        return None
+        Orphaned entries are never read again and age out through TTL expiry and LRU eviction.
+        """
+        return self._response_cache.invalidate(namespace)
+    
+    def _get_cached_response(self, cache_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get (response, tier) if cached and not expired; tier is 'memory' or 'disk'"""
+        if not config.cache_enabled:
+            return None, None
+        
+        return self._response_cache.get_with_tier(cache_key)
     
     def _save_to_cache(self, cache_key: str, response: str):
         """Save response to cache"""
         if not config.cache_enabled:
             return
         
-        cache_file = self._cache_dir / f"{cache_key}.json"
-        with open(cache_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'response': response
-            }, f)
+        self._response_cache.put(cache_key, response, config.cache_duration_hours * 3600)
+    
+    @staticmethod
+    def _semantic_scope(cache_key: str) -> str:
+        """Prompts are only compared with prompts of the same template and generation (the key minus its digest)"""
+        return cache_key.rsplit('/', 1)[0]
+    
+    def _get_semantic_response(self, cache_key: str, inputs: List[str]) -> Tuple[Optional[str], Optional[str]]:
+        """Get (response, 'semantic') cached for the most similar earlier prompt inputs, if similar enough"""
+        if not config.cache_enabled or not config.cache_semantic_enabled:
+            return None, None
+        
+        match = self._semantic.lookup(self._semantic_scope(cache_key), inputs)
+        if match is None:
+            return None, None
+        cached, _ = self._response_cache.get_with_tier(match[0])
+        if cached is None:
+            # Expired or evicted from the exact cache
+            self._semantic.discard(match[0])
+            return None, None
+        return cached, 'semantic'
     
-    def generate(self, prompt: str, context: str = "", use_cache: bool = True) -> Optional[str]:
-        """Generate content using Gemini API"""
+    def _index_semantic(self, cache_key: str, inputs: Optional[List[str]]):
+        """Make a cached response findable by near-identical prompt inputs"""
+        if inputs is not None and config.cache_enabled and config.cache_semantic_enabled:
+            self._semantic.add(cache_key, self._semantic_scope(cache_key), inputs)
+    
+    def get_semantic_stats(self) -> Dict[str, float]:
+        """Get entry count, lookups, hits and hit rate of the semantic cache layer"""
+        return self._semantic.stats()
+    
+    def generate(self, prompt: str, context: str = "", use_cache: bool = True, force: bool = False,
+                 on_chunk: Optional[Callable[[str], None]] = None, cache_only: bool = False,
+                 on_status: Optional[Callable[[str], None]] = None, page_name: Optional[str] = None,
+                 cache_key: Optional[str] = None, semantic_inputs: Optional[List[str]] = None) -> Optional[str]:
+        """Generate content using Gemini API
+        
+        Concurrent identical requests are coalesced into one API call unless force is True.
+        If on_chunk is given the response is streamed and on_chunk receives each piece of text
+        (cached or coalesced results are delivered as a single chunk).
+        With cache_only, a cache miss returns None instead of calling the API.
+        Calls are rate limited and retried with backoff; on_status receives progress messages
+        such as the caller's queue position. Each call is bounded by gemini.deadline_seconds, and
+        while the circuit breaker is open it fails immediately. A failed call raises GenerationError
+        with a message for the user.
+        Every call is recorded in the call metrics, attributed to page_name. cache_key overrides the
+        key derived from the prompt and context (see _get_template_key). With a template cache_key,
+        semantic_inputs (the normalized template arguments) let an exact cache miss be served from
+        the response to nearly identical inputs when cache.semantic_enabled is set.
+        """
+        result, _ = self._generate(prompt, context, use_cache=use_cache, force=force, on_chunk=on_chunk,
+                                   cache_only=cache_only, on_status=on_status, page_name=page_name,
+                                   cache_key=cache_key, semantic_inputs=semantic_inputs)
+        return result
+    
+    def _generate(self, prompt: str, context: str = "", use_cache: bool = True, force: bool = False,
+                  on_chunk: Optional[Callable[[str], None]] = None, cache_only: bool = False,
+                  on_status: Optional[Callable[[str], None]] = None,
+                  response_schema: Optional[Dict[str, Any]] = None, page_name: Optional[str] = None,
+                  cache_key: Optional[str] = None,
+                  semantic_inputs: Optional[List[str]] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Generate content, returning (result, source) where source is 'cache', 'api' or 'shared'
+        
+        With a response_schema the API is asked for JSON output matching it (JSON mode).
+        The call's wall time, token usage, cache tier and outcome are recorded in the call metrics.
+        """
         if not self.is_available:
-            return None
+            return None, None
         
-        cache_key = self._get_cache_key(prompt, context)
+        stats = {'cache_tier': None, 'outcome': 'error', 'prompt_tokens': 0, 'response_tokens': 0}
+        start = time.perf_counter()
+        try:
+            return self._generate_call(prompt, context, use_cache=use_cache, force=force, on_chunk=on_chunk,
+                                       cache_only=cache_only, on_status=on_status,
+                                       response_schema=response_schema, cache_key=cache_key,
+                                       semantic_inputs=semantic_inputs, page_name=page_name, stats=stats)
+        finally:
+            metrics.record(page=page_name, model=self._model_name, backend=config.gemini_backend,
+                           wall_ms=round((time.perf_counter() - start) * 1000, 1), **stats)
+    
+    def _generate_call(self, prompt: str, context: str, use_cache: bool, force: bool,
+                       on_chunk: Optional[Callable[[str], None]], cache_only: bool,
+                       on_status: Optional[Callable[[str], None]], response_schema: Optional[Dict[str, Any]],
+                       cache_key: Optional[str], semantic_inputs: Optional[List[str]], page_name: Optional[str],
+                       stats: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """Body of _generate; fills in stats (cache_tier, outcome, token counts) for the call metrics"""
+        if cache_key is None:
+            cache_key = self._get_cache_key(prompt, context)
+            semantic_inputs = None
         
-        # Check cache first
+        # Check cache first, then responses to near-identical inputs
         if use_cache:
-            cached = self._get_cached_response(cache_key)
+            cached, tier = self._get_cached_response(cache_key)
+            if cached:
+                self._index_semantic(cache_key, semantic_inputs)
+            elif semantic_inputs is not None:
+                cached, tier = self._get_semantic_response(cache_key, semantic_inputs)
+            stats['cache_tier'] = tier or 'miss'
             if cached:
-                return cached
+                stats['outcome'] = 'semantic_hit' if tier == 'semantic' else 'cache_hit'
+                if on_chunk:
+                    on_chunk(cached)
+                return cached, 'cache'
+        if cache_only or config.gemini_cache_only:
+            stats['outcome'] = 'cache_miss'
+            return None, None
+        
+        # Fail fast while the API is known to be down, so pages render from saved content
+        if circuit_breaker.is_open:
+            stats['outcome'] = 'circuit_open'
+            raise GenerationError(self._unavailable_message(), level='warning')
+        
+        # Overall time budget for queueing, retries and the API call itself
+        deadline = time.monotonic() + config.gemini_deadline_seconds
         
         try:
             model = self._get_model()
             if model is None:
-                st.error("Could not initialize Gemini model. Check your API key and internet connection.")
-                return None
+                raise GenerationError(self._model_error or "Could not initialize Gemini model. "
+                                      "Check your API key and internet connection.")
             
             full_prompt = f"{context}\n\n{prompt}" if context else prompt
-            response = model.generate_content(full_prompt)
-            result = response.text
             
-            # Cache the response
-            self._save_to_cache(cache_key, result)
+            # Reserve quota up front; actual usage is reconciled from the response metadata
+            estimated_tokens = len(full_prompt) // 4 + ESTIMATED_RESPONSE_TOKENS
+            delivered = []
+            
+            def on_wait(position: int):
+                if on_status:
+                    on_status(f"⏳ Queued, position {position} — waiting for Gemini API quota...")
             
-            return result
+            def on_retry(attempt: int, delay: float, error: Exception):
+                if on_status:
+                    on_status(f"⚠️ Gemini is busy ({getattr(error, 'code', 'error')}), retrying in {delay:.0f}s "
+                              f"(attempt {attempt}/{config.rate_limit_max_retries})...")
+            
+            def attempt():
+                rate_limiter.acquire(estimated_tokens, on_wait=on_wait, deadline=deadline)
+                if on_status:
+                    on_status("⏳ Generating fresh AI content...")
+                # Per-request timeout, never beyond the overall deadline
+                timeout = max(1.0, min(config.gemini_request_timeout_seconds, deadline - time.monotonic()))
+                request_options = {'timeout': timeout}
+                generation_config = None
+                if response_schema is not None:
+                    generation_config = {'response_mime_type': 'application/json',
+                                         'response_schema': response_schema}
+                # Offline models shape their responses by page; the live API takes no such argument
+                offline_options = {'page_name': page_name} if config.gemini_offline else {}
+                if on_chunk:
+                    response = model.generate_content(full_prompt, stream=True, generation_config=generation_config,
+                                                      request_options=request_options, **offline_options)
+                    for chunk in response:
+                        text = chunk.text
+                        delivered.append(text)
+                        on_chunk(text)
+                    result = ''.join(delivered)
+                else:
+                    response = model.generate_content(full_prompt, generation_config=generation_config,
+                                                      request_options=request_options, **offline_options)
+                    result = response.text
+                usage = getattr(response, 'usage_metadata', None)
+                if usage is not None:
+                    rate_limiter.record_usage(estimated_tokens, getattr(usage, 'total_token_count', 0))
+                    stats['prompt_tokens'] = getattr(usage, 'prompt_token_count', 0)
+                    stats['response_tokens'] = getattr(usage, 'candidates_token_count', 0)
+                return result
+            
+            def call():
+                if not circuit_breaker.allow():
+                    raise CircuitOpenError()
+                try:
+                    # A partly streamed response can't be retried without duplicating items
+                    result = call_with_retry(attempt, on_retry=on_retry, can_retry=lambda: not delivered,
+                                             deadline=deadline)
+                except QueueTimeoutError:
+                    # Never reached the API, so it says nothing about upstream health
+                    circuit_breaker.release()
+                    raise
+                except Exception:
+                    circuit_breaker.record_failure()
+                    raise
+                circuit_breaker.record_success()
+                # Cache the response
+                self._save_to_cache(cache_key, result)
+                self._index_semantic(cache_key, semantic_inputs)
+                return result
+            
+            if force:
+                result = call()
+                stats['outcome'] = 'ok'
+                return result, 'api'
+            
+            if on_status and self._inflight.in_flight(cache_key):
+                on_status("⏳ Waiting for an identical request already in progress...")
+            result, shared = self._inflight.do(cache_key, call, timeout=max(0.0, deadline - time.monotonic()))
+            if shared:
+                stats['outcome'] = 'shared'
+                if on_chunk:
+                    on_chunk(result)
+                return result, 'shared'
+            stats['outcome'] = 'ok'
+            return result, 'api'
+        except GenerationError:
+            raise
+        except CircuitOpenError:
+            stats['outcome'] = 'circuit_open'
+            raise GenerationError(self._unavailable_message(), level='warning')
+        except (TimeoutError, FutureTimeoutError):
+            stats['outcome'] = 'timeout'
+            raise GenerationError(f"⏱️ Gemini did not respond within {config.gemini_deadline_seconds:.0f}s. "
+                                  "Showing saved responses; please try again shortly.", level='warning')
         except Exception as e:
-            st.error(f"Gemini API error: {str(e)}")
+            raise GenerationError(f"Gemini API error: {str(e)}") from e
+    
+    @staticmethod
+    def _unavailable_message() -> str:
+        """Tell the user AI generation is paused by the circuit breaker"""
+        return (f"🔌 Gemini is temporarily unavailable after repeated failures. Showing saved responses; "
+                f"retrying automatically in {circuit_breaker.retry_in():.0f}s.")
+    
+    def _loads_json(self, response: str) -> Any:
+        """Strictly parse JSON from a Gemini response, handling code blocks (None if invalid)"""
+        text = response.strip()
+        if text.startswith("```json"):
+            text = text[7:]
+        if text.startswith("```"):
+            text = text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+        try:
+            return json.loads(text.strip())
+        except json.JSONDecodeError:
             return None
     
+    def _count_salvaged(self, items: int):
+        with self._salvage_lock:
+            self._salvaged_responses += 1
+            self._salvaged_items += items
+    
     def _parse_json_response(self, response: str) -> Any:
-        """Parse JSON from Gemini response, handling code blocks"""
+        """Parse JSON from Gemini response, handling code blocks
+        
+        Malformed arrays (truncated, trailing commas, surrounding prose) are salvaged item by item.
+        """
         if not response:
             return None
-        response = response.strip()
-        if response.startswith("```json"):
-            response = response[7:]
-        if response.startswith("```"):
-            response = response[3:]
-        if response.endswith("```"):
-            response = response[:-3]
-        try:
-            return json.loads(response.strip())
-        except json.JSONDecodeError:
+        parsed = self._loads_json(response)
+        if parsed is not None:
+            return parsed
+        
+        items = salvage_json_array(response)
+        if not items:
             return None
-
-    def get_dictionary_additions(self, existing_terms: List[str], use_cache: bool = False) -> List[Dict[str, Any]]:
-        """Get additional aviation terms from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('dictionary'):
-            return []
+        self._count_salvaged(len(items))
+        return items
+    
+    def _parse_json_sections(self, response: str, keys: List[str]) -> Dict[str, List[Any]]:
+        """Parse a keyed JSON object of arrays, salvaging each section of a malformed response"""
+        if not response:
+            return {}
+        parsed = self._loads_json(response)
+        if isinstance(parsed, dict):
+            return {key: parsed[key] for key in keys if isinstance(parsed.get(key), list)}
+        
+        sections = salvage_json_sections(response, keys)
+        if sections:
+            self._count_salvaged(sum(len(items) for items in sections.values()))
+        return sections
+    
+    def get_salvage_stats(self) -> Dict[str, int]:
+        """Get how many malformed responses (and items within them) were recovered"""
+        with self._salvage_lock:
+            return {'responses': self._salvaged_responses, 'items': self._salvaged_items}
+    
+    def _generate_page(self, page_name: str, builder: Callable[..., Tuple[str, str]], args: tuple,
+                       **kwargs) -> List[Dict[str, Any]]:
+        """Render a page's prompt template with args and generate its items under a template cache key"""
+        prompt, context = builder(*args)
+        return self._generate_items(page_name, prompt, context,
+                                    cache_key=self._get_template_key(page_name, builder, args),
+                                    semantic_inputs=_semantic_inputs(args), **kwargs)
+    
+    def _generate_items(self, page_name: str, prompt: str, context: str, use_cache: bool = False,
+                        force: bool = False, on_item: Optional[Callable[[Any], None]] = None,
+                        on_status: Optional[Callable[[str], None]] = None,
+                        cache_key: Optional[str] = None,
+                        semantic_inputs: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Generate a JSON array of items for a page and record fresh results in its history
         
+        If on_item is given the response is streamed and on_item is called with each item as soon
+        as it is complete. In JSON mode the page's response schema is sent with the request.
+        """
+        items, source = self._request_items(page_name, prompt, context, use_cache=use_cache, force=force,
+                                            on_item=on_item, on_status=on_status, cache_key=cache_key,
+                                            semantic_inputs=semantic_inputs)
+        # Only the caller that actually made the API call saves to page history,
+        # so coalesced and cached results don't create duplicate entries
+        if items and source == 'api':
+            self._save_to_page_cache(page_name, items)
+        return items
+    
+    def _request_items(self, page_name: str, prompt: str, context: str, use_cache: bool = False,
+                       force: bool = False, on_item: Optional[Callable[[Any], None]] = None,
+                       on_status: Optional[Callable[[str], None]] = None,
+                       cache_key: Optional[str] = None,
+                       semantic_inputs: Optional[List[str]] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Generate and validate a page's JSON array of items; returns (items, source) like _generate"""
+        on_chunk = None
+        parser = None
+        if on_item:
+            parser = JSONArrayStreamParser()
+            
+            def on_chunk(text: str):
+                for item in parser.feed(text):
+                    on_item(item)
+        
+        schema = RESPONSE_SCHEMAS.get(page_name) if config.gemini_json_mode else None
+        response, source = self._generate(prompt, context, use_cache=use_cache, force=force, on_chunk=on_chunk,
+                                          on_status=on_status, response_schema=schema, page_name=page_name,
+                                          cache_key=cache_key, semantic_inputs=semantic_inputs)
+        items = self._parse_json_response(response)
+        if not isinstance(items, list) and parser is not None:
+            items = parser.items
+        
+        if items and isinstance(items, list):
+            items = validate_items(page_name, items)
+        if items and isinstance(items, list):
+            return items, source
+        return [], source
+
+    def _dictionary_prompt(self, existing_terms: List[str]) -> Tuple[str, str]:
+        """Build the (prompt, context) for dictionary additions"""
         context = f"""You are an aviation expert helping a pilot candidate prepare for their Turkish Airlines interview.
         
 The following aviation terms/abbreviations are already in the dictionary:
@@ -252,21 +753,120 @@ Focus on terms that would be relevant for a cadet pilot interview."""
 ]
 
 Return ONLY the JSON array, no other text."""
+        return prompt, context
+    
+    def _dictionary_topup_prompt(self, known_terms: List[str], count: int) -> Tuple[str, str]:
+        """Build the (prompt, context) for a follow-up request for more dictionary terms"""
+        context = f"""You are an aviation expert helping a pilot candidate prepare for their Turkish Airlines interview.
 
-        response = self.generate(prompt, context, use_cache=use_cache)
-        terms = self._parse_json_response(response)
-        
-        if terms and isinstance(terms, list):
-            # Save to page cache
-            self._save_to_page_cache('dictionary', terms)
-            return terms
-        return []
+The dictionary already contains ALL of the following aviation terms/abbreviations:
+{', '.join(known_terms)}
+
+Please suggest {count} ADDITIONAL important aviation terms that are NOT in the list above
+(including spelling, abbreviation or hyphenation variants of them).
+Focus on terms that would be relevant for a cadet pilot interview."""
+
+        prompt, _ = self._dictionary_prompt([])
+        return prompt, context
     
-    def get_news_updates(self, use_cache: bool = False) -> List[Dict[str, Any]]:
-        """Get recent aviation news from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('news'):
+    def get_dictionary_additions(self, existing_terms: List[str], use_cache: bool = False, force: bool = False,
+                                 on_item: Optional[Callable[[Any], None]] = None,
+                                 on_status: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Get additional aviation terms from Gemini, only ones not in existing_terms or suggested before
+        
+        Suggested terms are checked against a normalized set of the dictionary's terms, every term in
+        the AI term store and the terms in the page history. While fewer than dictionary_topup.target_terms new terms have been found,
+        follow-up requests listing all known terms ask for the rest, up to dictionary_topup.max_requests
+        requests. The merged new terms are cached under the first request's key, saved to the page
+        history and added to the AI term store; when there are none, nothing is cached.
+        """
+        if not self.is_available or not config.is_ai_enabled_for('dictionary'):
             return []
         
+        known = {normalize_term(term): term for term in existing_terms}
+        in_dictionary = set(known)
+        previous = self._ai_terms.terms() + [
+            item['term'] for entry in self._load_page_cache('dictionary')
+            if isinstance(entry['data'], list) for item in entry['data']
+            if isinstance(item, dict) and item.get('term')
+        ]
+        for term in previous:
+            known.setdefault(normalize_term(term), term)
+        
+        # Stream only suggestions that are new, and each only once. A cached result has been topped up
+        # already (and its terms are in the term store by now), so with use_cache items are passed on at the end
+        stream = on_item is not None and not use_cache
+        shown = set(known)
+        
+        def on_new_item(item: Any):
+            key = normalize_term(item.get('term', '')) if isinstance(item, dict) else ''
+            if key and key not in shown:
+                shown.add(key)
+                on_item(item)
+        
+        args = (existing_terms,)
+        cache_key = self._get_template_key('dictionary', self._dictionary_prompt, args)
+        prompt, context = self._dictionary_prompt(*args)
+        items, source = self._request_items('dictionary', prompt, context, use_cache=use_cache, force=force,
+                                            on_item=on_new_item if stream else None, on_status=on_status,
+                                            cache_key=cache_key, semantic_inputs=_semantic_inputs(args))
+        new_terms = []
+        if source == 'cache':
+            # A cached response was checked against the suggestions made before it, and its own terms are
+            # among those by now; a near-identical (semantic) hit was made for another term list, though,
+            # so drop terms this dictionary already has and repeats within the response
+            seen = set(in_dictionary)
+            for item in items:
+                key = normalize_term(item['term'])
+                if key and key not in seen:
+                    seen.add(key)
+                    new_terms.append(item)
+        
+        generated = source == 'api'
+        requests_made = 1
+        target = config.dictionary_topup_target_terms
+        while source != 'cache':
+            for item in items:
+                key = normalize_term(item['term'])
+                if key and key not in known:
+                    known[key] = item['term']
+                    new_terms.append(item)
+            # A coalesced caller gets the first response; the caller that made it does the top-up
+            if source != 'api' or len(new_terms) >= target or requests_made >= config.dictionary_topup_max_requests:
+                break
+            
+            if on_status:
+                on_status(f"⏳ {len(new_terms)} new terms so far, asking Gemini for more...")
+            topup_args = (sorted(known.values(), key=str.casefold), min(20, target - len(new_terms) + 5))
+            prompt, context = self._dictionary_topup_prompt(*topup_args)
+            try:
+                items, source = self._request_items('dictionary', prompt, context, force=force,
+                                                    on_item=on_new_item if stream else None, on_status=on_status,
+                                                    cache_key=self._get_template_key(
+                                                        'dictionary', self._dictionary_topup_prompt, topup_args))
+            except GenerationError:
+                # Keep the new terms found so far
+                break
+            generated = generated or source == 'api'
+            requests_made += 1
+        
+        if generated:
+            if new_terms:
+                # Replaces the first response, so cache hits get the merged new terms only
+                self._save_to_cache(cache_key, json.dumps(new_terms))
+                self._save_to_page_cache('dictionary', new_terms)
+                self._ai_terms.add(new_terms)
+            else:
+                # Nothing new this time: drop the first response rather than serve its known terms, or an
+                # empty result, until it expires, so the next visit or prefetch asks Gemini again
+                self._response_cache.delete(cache_key)
+        if on_item and not stream:
+            for item in new_terms:
+                on_item(item)
+        return new_terms
+    
+    def _news_prompt(self) -> Tuple[str, str]:
+        """Build the (prompt, context) for news updates"""
         context = """You are an aviation industry analyst helping a Turkish Airlines cadet pilot candidate 
 prepare for their interview scheduled for March/April 2026."""
 
@@ -285,20 +885,20 @@ Return your response as a valid JSON array with this exact format:
 ]
 
 Return ONLY the JSON array, no other text."""
-
-        response = self.generate(prompt, context, use_cache=use_cache)
-        news = self._parse_json_response(response)
-        
-        if news and isinstance(news, list):
-            self._save_to_page_cache('news', news)
-            return news
-        return []
+        return prompt, context
     
-    def get_history_additions(self, existing_years: List[int], use_cache: bool = False) -> List[Dict[str, Any]]:
-        """Get additional aviation history events from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('history'):
+    def get_news_updates(self, use_cache: bool = False, force: bool = False,
+                         on_item: Optional[Callable[[Any], None]] = None,
+                         on_status: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Get recent aviation news from Gemini"""
+        if not self.is_available or not config.is_ai_enabled_for('news'):
             return []
         
+        return self._generate_page('news', self._news_prompt, (),
+                                   use_cache=use_cache, force=force, on_item=on_item, on_status=on_status)
+    
+    def _history_prompt(self, existing_years: List[int]) -> Tuple[str, str]:
+        """Build the (prompt, context) for history additions"""
         context = f"""You are an aviation historian helping a pilot candidate learn aviation history.
         
 The following years already have events covered:
@@ -318,20 +918,20 @@ Return your response as a valid JSON array with this exact format:
 ]
 
 Return ONLY the JSON array, no other text."""
-
-        response = self.generate(prompt, context, use_cache=use_cache)
-        events = self._parse_json_response(response)
-        
-        if events and isinstance(events, list):
-            self._save_to_page_cache('history', events)
-            return events
-        return []
+        return prompt, context
     
-    def get_fleet_insights(self, fleet_summary: str, use_cache: bool = False) -> List[Dict[str, Any]]:
-        """Get fleet insights from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('fleet'):
+    def get_history_additions(self, existing_years: List[int], use_cache: bool = False, force: bool = False,
+                              on_item: Optional[Callable[[Any], None]] = None,
+                              on_status: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Get additional aviation history events from Gemini"""
+        if not self.is_available or not config.is_ai_enabled_for('history'):
             return []
         
+        return self._generate_page('history', self._history_prompt, (existing_years,),
+                                   use_cache=use_cache, force=force, on_item=on_item, on_status=on_status)
+    
+    def _fleet_insights_prompt(self, fleet_summary: str) -> Tuple[str, str]:
+        """Build the (prompt, context) for fleet insights"""
         context = f"""You are an aviation expert helping a Turkish Airlines cadet pilot candidate.
         
 Current THY Fleet Summary:
@@ -351,20 +951,20 @@ Return your response as a valid JSON array with this exact format:
 ]
 
 Return ONLY the JSON array, no other text."""
-
-        response = self.generate(prompt, context, use_cache=use_cache)
-        insights = self._parse_json_response(response)
-        
-        if insights and isinstance(insights, list):
-            self._save_to_page_cache('fleet', insights)
-            return insights
-        return []
+        return prompt, context
     
-    def get_destinations_insights(self, destinations_summary: str, use_cache: bool = False) -> List[Dict[str, Any]]:
-        """Get destinations insights from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('destinations'):
+    def get_fleet_insights(self, fleet_summary: str, use_cache: bool = False, force: bool = False,
+                           on_item: Optional[Callable[[Any], None]] = None,
+                           on_status: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Get fleet insights from Gemini"""
+        if not self.is_available or not config.is_ai_enabled_for('fleet'):
             return []
         
+        return self._generate_page('fleet', self._fleet_insights_prompt, (fleet_summary,),
+                                   use_cache=use_cache, force=force, on_item=on_item, on_status=on_status)
+    
+    def _destinations_insights_prompt(self, destinations_summary: str) -> Tuple[str, str]:
+        """Build the (prompt, context) for destinations insights"""
         context = f"""You are an aviation expert helping a Turkish Airlines cadet pilot candidate.
         
 Current THY Network Summary:
@@ -384,20 +984,20 @@ Return your response as a valid JSON array with this exact format:
 ]
 
 Return ONLY the JSON array, no other text."""
-
-        response = self.generate(prompt, context, use_cache=use_cache)
-        insights = self._parse_json_response(response)
-        
-        if insights and isinstance(insights, list):
-            self._save_to_page_cache('destinations', insights)
-            return insights
-        return []
+        return prompt, context
     
-    def get_future_insights(self, existing_topics: List[str], use_cache: bool = False) -> List[Dict[str, Any]]:
-        """Get additional future aviation insights from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('future'):
+    def get_destinations_insights(self, destinations_summary: str, use_cache: bool = False, force: bool = False,
+                                  on_item: Optional[Callable[[Any], None]] = None,
+                                  on_status: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Get destinations insights from Gemini"""
+        if not self.is_available or not config.is_ai_enabled_for('destinations'):
             return []
         
+        return self._generate_page('destinations', self._destinations_insights_prompt, (destinations_summary,),
+                                   use_cache=use_cache, force=force, on_item=on_item, on_status=on_status)
+    
+    def _future_insights_prompt(self, existing_topics: List[str]) -> Tuple[str, str]:
+        """Build the (prompt, context) for future aviation insights"""
         context = f"""You are an aviation technology analyst providing insights about the future of aviation.
         
 Topics already covered include:
@@ -418,20 +1018,139 @@ Return your response as a valid JSON array with this exact format:
 ]
 
 Return ONLY the JSON array, no other text."""
-
-        response = self.generate(prompt, context, use_cache=use_cache)
-        insights = self._parse_json_response(response)
+        return prompt, context
+    
+    def get_future_insights(self, existing_topics: List[str], use_cache: bool = False, force: bool = False,
+                            on_item: Optional[Callable[[Any], None]] = None,
+                            on_status: Optional[Callable[[str], None]] = None) -> List[Dict[str, Any]]:
+        """Get additional future aviation insights from Gemini"""
+        if not self.is_available or not config.is_ai_enabled_for('future'):
+            return []
         
-        if insights and isinstance(insights, list):
-            self._save_to_page_cache('future', insights)
-            return insights
-        return []
+        return self._generate_page('future', self._future_insights_prompt, (existing_topics,),
+                                   use_cache=use_cache, force=force, on_item=on_item, on_status=on_status)
     
-    def get_training_aircraft_tips(self, aircraft: str, existing_content: str) -> Optional[str]:
-        """Get additional tips for training aircraft from Gemini"""
-        if not self.is_available or not config.is_ai_enabled_for('training_aircraft'):
-            return None
+    def get_insights_batch(self, requests: Dict[str, tuple], use_cache: bool = True, force: bool = False,
+                           on_status: Optional[Callable[[str], None]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Get insights for several pages (fleet, destinations, future) in a single API call
+        
+        requests maps each page to the arguments of its get_*_insights method. Pages with a cached
+        response are served from the cache; the rest are merged into one multi-section prompt whose
+        keyed JSON response is split back per page. Each part is cached under the page's own cache key
+        and saved to the page's history, exactly as if it had been generated on its own. Pages missing
+        from the batch response, or all of them if the batch call fails, are generated individually;
+        GenerationError is only raised if no page gets any items.
+        """
+        results = {}
+        pending = {}
+        for page_name, args in requests.items():
+            if page_name not in self.BATCHABLE_INSIGHTS or not self.is_available \
+                    or not config.is_ai_enabled_for(page_name):
+                continue
+            builder = getattr(self, self.BATCHABLE_INSIGHTS[page_name][1])
+            prompt, context = builder(*args)
+            cache_key = self._get_template_key(page_name, builder, tuple(args))
+            semantic_inputs = _semantic_inputs(tuple(args))
+            if use_cache:
+                cached, _ = self._get_cached_response(cache_key)
+                if cached:
+                    self._index_semantic(cache_key, semantic_inputs)
+                else:
+                    cached, _ = self._get_semantic_response(cache_key, semantic_inputs)
+                items = self._parse_json_response(cached)
+                if isinstance(items, list) and items:
+                    results[page_name] = items
+                    continue
+            pending[page_name] = (prompt, context, cache_key, semantic_inputs)
         
+        if len(pending) > 1:
+            schema = None
+            if config.gemini_json_mode:
+                schema = {'type': 'object', 'properties': {page: RESPONSE_SCHEMAS[page] for page in pending},
+                          'required': list(pending)}
+            # Derived from the pages' keys, so invalidating any of them also misses the batch
+            batch_key = 'batch/' + hashlib.md5('|'.join(entry[2] for entry in pending.values()).encode()).hexdigest()
+            try:
+                response, source = self._generate(self._batch_prompt(pending), use_cache=use_cache, force=force,
+                                                  on_status=on_status, response_schema=schema,
+                                                  page_name='+'.join(pending), cache_key=batch_key)
+            except GenerationError:
+                # Possibly transient: every page falls through to its own call below
+                response, source = None, None
+            
+            sections = self._parse_json_sections(response, list(pending))
+            for page_name, items in sections.items():
+                items = validate_items(page_name, items)
+                if not items:
+                    continue
+                _, _, cache_key, semantic_inputs = pending.pop(page_name)
+                self._save_to_cache(cache_key, json.dumps(items))
+                self._index_semantic(cache_key, semantic_inputs)
+                if source == 'api':
+                    self._save_to_page_cache(page_name, items)
+                results[page_name] = items
+        
+        errors = []
+        for page_name, (prompt, context, cache_key, semantic_inputs) in pending.items():
+            try:
+                results[page_name] = self._generate_items(page_name, prompt, context, use_cache=False, force=force,
+                                                          on_status=on_status, cache_key=cache_key,
+                                                          semantic_inputs=semantic_inputs)
+            except GenerationError as e:
+                # One page failing doesn't lose the others
+                results[page_name] = []
+                errors.append(e)
+        if errors and not any(results.values()):
+            raise errors[0]
+        return results
+    
+    def export_saved_content(self) -> Dict[str, Any]:
+        """Get every unexpired cached response and each page's history, e.g. for a precompute bundle"""
+        return {
+            'cache': [
+                {'key': key, 'value': value, 'created_at': created_at}
+                for key, value, created_at in self._response_cache.disk.entries()
+            ],
+            'history': {page: self._history.latest(page) for page in self._history.pages()},
+        }
+    
+    def import_saved_content(self, content: Dict[str, Any]) -> Tuple[int, int]:
+        """Load content from export_saved_content; returns (cache entries, history entries) added
+        
+        Responses already in the cache are kept, and history entries are only added if newer than
+        the page's latest, so importing the same content twice changes nothing.
+        """
+        cache_added = 0
+        for entry in content.get('cache', []):
+            cache_key = self._localize_template_key(entry['key'])
+            if self._response_cache.get(cache_key) is None:
+                self._save_to_cache(cache_key, entry['value'])
+                cache_added += 1
+        history_added = 0
+        for page_name, entries in content.get('history', {}).items():
+            self._ensure_page_history(page_name)
+            history_added += self._history.import_entries(page_name, entries)
+        return cache_added, history_added
+    
+    def _batch_prompt(self, pending: Dict[str, Tuple[str, str, str, List[str]]]) -> str:
+        """Merge several pages' (prompt, context, cache key, inputs) into one prompt asking for a keyed JSON object"""
+        sections = "\n\n".join(
+            f'=== Section "{page_name}" ===\n{context}\n\n{prompt}'
+            for page_name, (prompt, context, _, _) in pending.items()
+        )
+        keys = ', '.join(f'"{page_name}"' for page_name in pending)
+        return f"""Answer each of the following sections independently.
+
+{sections}
+
+=== Response format ===
+Instead of separate arrays, return a single valid JSON object with the keys {keys}.
+The value of each key is the JSON array requested in that section, in exactly the format given there.
+
+Return ONLY the JSON object, no other text."""
+    
+    def _training_aircraft_tips_prompt(self, aircraft: str, existing_content: str) -> Tuple[str, str]:
+        """Build the (prompt, context) for training aircraft tips"""
         context = f"""You are a flight instructor helping a student prepare for their interview about the {aircraft}.
         
 The student already knows about:
@@ -441,8 +1160,20 @@ The student already knows about:
 a cadet pilot candidate. Focus on things an interviewer might ask about.
 
 Format your response as a bullet-point list that can be displayed directly. Keep it concise."""
-
-        return self.generate(prompt, context)
+        return prompt, context
+    
+    def get_training_aircraft_tips(self, aircraft: str, existing_content: str, use_cache: bool = True,
+                                   force: bool = False,
+                                   on_status: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """Get additional tips for training aircraft from Gemini"""
+        if not self.is_available or not config.is_ai_enabled_for('training_aircraft'):
+            return None
+        
+        args = (aircraft, existing_content)
+        prompt, context = self._training_aircraft_tips_prompt(*args)
+        cache_key = self._get_template_key('training_aircraft', self._training_aircraft_tips_prompt, args)
+        return self.generate(prompt, context, use_cache=use_cache, force=force, on_status=on_status,
+                             page_name='training_aircraft', cache_key=cache_key, semantic_inputs=_semantic_inputs(args))
 
 
 def render_ai_content_indicator():
@@ -584,6 +1315,29 @@ def render_ai_card(content: Dict[str, Any], card_type: str = "generic"):
         """, unsafe_allow_html=True)
 
 
+# How often a page polls for a finished background refresh or generation job
+REFRESH_POLL_SECONDS = 2
+
+
+def _is_stale(entry: Optional[Dict[str, Any]], max_age_hours: float) -> bool:
+    """Check if a page history entry is missing or older than max_age_hours"""
+    if not entry:
+        return True
+    try:
+        generated = datetime.fromisoformat(entry['timestamp'])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return datetime.now() - generated > timedelta(hours=max_age_hours)
+
+
+def _format_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp for display"""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%b %d, %Y at %H:%M")
+    except (TypeError, ValueError):
+        return timestamp
+
+
 def render_cache_history(page_name: str, card_type: str = "generic"):
     """Render cache history for a page with expandable sections"""
     history = gemini.get_cache_history(page_name)
@@ -612,8 +1366,13 @@ def render_cache_history(page_name: str, card_type: str = "generic"):
 
 
 def render_ai_section(page_name: str, card_type: str, generate_func, generate_args: tuple = (), 
-                      section_title: str = "🤖 AI Insights"):
-    """Render a complete AI section with fresh/cached buttons for a page"""
+                      section_title: str = "🤖 AI Insights", force: bool = False):
+    """Render a complete AI section with fresh/cached buttons for a page
+    
+    Fresh responses are generated by an interactive-priority job (see utils.jobs) that the section
+    polls, so the rest of the page stays usable meanwhile. Fresh requests from concurrent sessions share
+    one job and API call; pass force=True to always make a separate generation.
+    """
     
     if not config.is_ai_enabled_for(page_name):
         if gemini.is_available:
@@ -634,35 +1393,118 @@ def render_ai_section(page_name: str, card_type: str, generate_func, generate_ar
     # Session state keys
     current_key = f'ai_{page_name}_current'
     show_history_key = f'ai_{page_name}_show_history'
+    job_key = f'ai_{page_name}_job'
+    error_key = f'ai_{page_name}_error'
+    
+    jobs.start(gemini)
     
     if current_key not in st.session_state:
         st.session_state[current_key] = None
     if show_history_key not in st.session_state:
         st.session_state[show_history_key] = False
+    if job_key not in st.session_state:
+        st.session_state[job_key] = None
     
     # Buttons
     col1, col2, col3 = st.columns([1, 1, 1])
     
     with col1:
-        if st.button("🔄 Get Fresh AI Response", key=f"fresh_{page_name}", use_container_width=True):
-            with st.spinner("Generating fresh AI content..."):
-                result = generate_func(*generate_args, use_cache=False)
-                st.session_state[current_key] = result
-                st.session_state[show_history_key] = False
+        fresh_requested = st.button("🔄 Get Fresh AI Response", key=f"fresh_{page_name}", use_container_width=True,
+                                    disabled=config.gemini_cache_only or st.session_state[job_key] is not None,
+                                    help="Live AI calls are turned off (gemini.cache_only)" if config.gemini_cache_only else None)
     
     with col2:
         if st.button("📜 Show Previous Responses", key=f"history_{page_name}", use_container_width=True):
             st.session_state[show_history_key] = not st.session_state[show_history_key]
     
     with col3:
-        history = gemini.get_cache_history(page_name)
-        st.caption(f"📦 {len(history)} cached")
+        # Filled in after any generation so the count includes the new response
+        cached_count = st.empty()
+    
+    if fresh_requested and st.session_state[job_key] is None:
+        # Resolve the model in the script thread, since selection may need the UI
+        if gemini._get_model_interactive() is not None:
+            # A forced generation never joins another session's job
+            st.session_state[job_key] = jobs.submit(page_name, generate_func.__name__, tuple(generate_args),
+                                                    priority=INTERACTIVE, stream=config.stream_responses,
+                                                    dedupe=not force, use_cache=False, force=force)
+            st.session_state[show_history_key] = False
+    job = st.session_state[job_key]
+    
+    cached_count.caption(f"📦 {gemini.get_cache_history_count(page_name)} cached")
+    
+    # Stale-while-revalidate: serve the newest saved response instantly and refresh it
+    # in the background once it is older than the page's freshness threshold
+    latest_entries = gemini.get_cache_history(page_name, limit=1)
+    latest = latest_entries[0] if latest_entries else None
+    circuit_open = circuit_breaker.is_open
+    # A refresh that fails or returns nothing saves no history, so attempts are rate-limited separately
+    if (job is None and not circuit_open and not config.gemini_cache_only
+            and _is_stale(latest, config.ai_freshness_hours(page_name)) and gemini.claim_refresh(page_name)):
+        prefetch.refresh(page_name, generate_func, generate_args)
+    refreshing = prefetch.is_refreshing(page_name)
+    
+    @st.fragment(run_every=REFRESH_POLL_SECONDS if refreshing or job is not None else None)
+    def render_current_response():
+        if job is not None:
+            if job.done():
+                # Fresh response is ready: show it (or the saved ones if the job failed or was cancelled)
+                st.session_state[job_key] = None
+                try:
+                    st.session_state[current_key] = job.result()
+                except CancelledError:
+                    pass
+                except GenerationError as e:
+                    st.session_state[current_key] = None
+                    st.session_state[error_key] = (e.level, str(e))
+                except Exception as e:
+                    st.session_state[current_key] = None
+                    st.session_state[error_key] = ('error', f"⚠️ AI generation failed: {e}")
+                st.rerun()
+            
+            status_col, cancel_col = st.columns([3, 1])
+            status_col.caption(job.status)
+            if cancel_col.button("✖️ Cancel", key=f"cancel_{page_name}", use_container_width=True):
+                jobs.cancel(job)
+                st.session_state[job_key] = None
+                st.rerun()
+            streamed = job.items()
+            if streamed:
+                # Render each card as soon as it has been streamed in
+                st.markdown("**✨ Current AI Response:**")
+                for item in streamed:
+                    render_ai_card(item, card_type)
+                return
+        
+        # Why the last fresh request failed, shown once after the rerun that ended its job
+        error = st.session_state.pop(error_key, None)
+        if error is not None:
+            level, message = error
+            getattr(st, level)(message)
+        
+        if refreshing and not prefetch.is_refreshing(page_name):
+            # Background refresh finished: swap in the new response
+            st.session_state[current_key] = None
+            st.rerun()
+        
+        items = st.session_state[current_key]
+        timestamp = None
+        if not items and latest and isinstance(latest.get('data'), list):
+            items = latest['data']
+            timestamp = latest.get('timestamp')
+        
+        if refreshing:
+            st.caption("🔄 Refreshing AI content in the background...")
+        elif circuit_open:
+            st.caption("🔌 AI service temporarily unavailable — showing saved responses")
+        if items:
+            st.markdown("**✨ Current AI Response:**")
+            if timestamp:
+                st.caption(f"🕒 Generated {_format_timestamp(timestamp)}")
+            for item in items:
+                render_ai_card(item, card_type)
     
-    # Display current results
-    if st.session_state[current_key]:
-        st.markdown("**✨ Current AI Response:**")
-        for item in st.session_state[current_key]:
-            render_ai_card(item, card_type)
+    render_current_response()
     
     # Display history
     if st.session_state[show_history_key]:
@@ -673,3 +1515,5 @@ def render_ai_section(page_name: str, card_type: str, generate_func, generate_ar
 # Singleton instance
 gemini = GeminiHelper()
 
+# Import the precomputed AI content bundle (if any) once per process, whichever page a worker serves first
+load_bundle_at_boot(gemini)
@@ -0,0 +1,185 @@
+"""
+Page History Store for THY Cadet Pilot Prep App
+Append-only log of AI responses per page, kept in the shared SQLite (WAL mode) database
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.cache_store import connect
+
+
+class HistoryStore:
+    """Append-only per-page response history with a retention limit and indexed latest-N reads"""
+
+    def __init__(self, db_path: Path, retention: int):
+        self._db_path = db_path
+        self._retention = retention
+        self._local = threading.local()
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get the connection for the current thread (sqlite3 connections are not thread-safe)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self._db_path)
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """Create tables and indexes if they don't exist"""
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                page TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                data TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_page_history_page ON page_history(page, id)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_refresh_attempts (
+                page TEXT PRIMARY KEY,
+                attempted_at TEXT NOT NULL
+            )
+        """)
+
+    def append(self, page_name: str, data: Any, timestamp: Optional[str] = None):
+        """Append an entry and drop entries beyond the retention limit, atomically"""
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._insert(conn, page_name, data, timestamp or datetime.now().isoformat())
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            pass
+
+    def _insert(self, conn: sqlite3.Connection, page_name: str, data: Any, timestamp: str):
+        """Insert an entry and apply retention (caller holds the write transaction)"""
+        conn.execute(
+            "INSERT INTO page_history (page, timestamp, data) VALUES (?, ?, ?)",
+            (page_name, timestamp, json.dumps(data))
+        )
+        conn.execute(
+            "DELETE FROM page_history WHERE page = ? AND id <= ("
+            "  SELECT id FROM page_history WHERE page = ? ORDER BY id DESC LIMIT 1 OFFSET ?"
+            ")",
+            (page_name, page_name, self._retention)
+        )
+
+    def latest(self, page_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get the newest entries for a page (newest first), only decoding the rows requested"""
+        limit = self._retention if limit is None else limit
+        try:
+            rows = self._conn().execute(
+                "SELECT timestamp, data FROM page_history WHERE page = ? ORDER BY id DESC LIMIT ?",
+                (page_name, limit)
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+
+        entries = []
+        for timestamp, data in rows:
+            try:
+                entries.append({'timestamp': timestamp, 'data': json.loads(data)})
+            except json.JSONDecodeError:
+                continue
+        return entries
+
+    def count(self, page_name: str) -> int:
+        """Get the number of saved entries for a page"""
+        try:
+            return self._conn().execute(
+                "SELECT COUNT(*) FROM page_history WHERE page = ?", (page_name,)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def claim_refresh(self, page_name: str, min_interval_hours: float) -> bool:
+        """Record a background refresh attempt unless one was made in the last min_interval_hours
+
+        Returns True if this call recorded the attempt. Attempts are recorded however they end, since a
+        failed or empty generation saves no entry and would otherwise leave the page stale forever.
+        """
+        now = datetime.now()
+        cutoff = (now - timedelta(hours=min_interval_hours)).isoformat()
+        try:
+            cursor = self._conn().execute(
+                "INSERT INTO page_refresh_attempts (page, attempted_at) VALUES (?, ?) "
+                "ON CONFLICT(page) DO UPDATE SET attempted_at = excluded.attempted_at WHERE attempted_at < ?",
+                (page_name, now.isoformat(), cutoff)
+            )
+        except sqlite3.Error:
+            return False
+        return cursor.rowcount > 0
+
+    def pages(self) -> List[str]:
+        """Get the names of all pages with saved entries"""
+        try:
+            return [row[0] for row in self._conn().execute("SELECT DISTINCT page FROM page_history ORDER BY page")]
+        except sqlite3.Error:
+            return []
+
+    def import_entries(self, page_name: str, entries: List[Dict[str, Any]]) -> int:
+        """Append entries (newest first, as returned by latest) that are newer than the page's newest entry
+
+        Importing the same entries again adds nothing, and older entries never hide newer ones.
+        Returns the number of entries added.
+        """
+        added = 0
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT timestamp FROM page_history WHERE page = ? ORDER BY id DESC LIMIT 1", (page_name,)
+                ).fetchone()
+                newest = row[0] if row else ''
+                for entry in reversed(entries[:self._retention]):
+                    if entry.get('timestamp', '') > newest and 'data' in entry:
+                        self._insert(conn, page_name, entry['data'], entry['timestamp'])
+                        added += 1
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            return 0
+        return added
+
+    def import_legacy(self, page_name: str, history_file: Path):
+        """Import a legacy history_{page}.json file if the page has no entries yet"""
+        if not history_file.exists() or self.count(page_name):
+            return
+        try:
+            with open(history_file, 'r') as f:
+                history = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-check inside the write lock so concurrent processes import only once
+                if not conn.execute("SELECT 1 FROM page_history WHERE page = ? LIMIT 1", (page_name,)).fetchone():
+                    # Legacy files are newest first; insert oldest first to keep id order
+                    for entry in reversed(history[:self._retention]):
+                        if isinstance(entry, dict) and 'data' in entry:
+                            timestamp = entry.get('timestamp') or datetime.now().isoformat()
+                            self._insert(conn, page_name, entry['data'], timestamp)
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            pass
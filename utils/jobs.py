@@ -0,0 +1,335 @@
+"""
+AI Job Queue for THY Cadet Pilot Prep App
+Durable priority queue of AI generations (interactive > prefetch > nightly) served by a background dispatcher
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.cache_store import connect
+from utils.config import config
+from utils.rate_limit import rate_limiter
+
+# Job priorities, most urgent first
+INTERACTIVE = 0  # a user is waiting for it ("Get Fresh AI Response")
+PREFETCH = 1     # speculative cache warmup and stale-while-revalidate refreshes
+NIGHTLY = 2      # bulk regeneration (python -m utils.precompute)
+
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', PREFETCH: 'prefetch', NIGHTLY: 'nightly'}
+
+# How often a dispatcher marks itself alive and adopts the jobs of dispatchers that stopped doing so
+HEARTBEAT_SECONDS = 10
+OWNER_TIMEOUT_SECONDS = 3 * HEARTBEAT_SECONDS
+
+
+class Job:
+    """Handle to a queued generation, safe to keep in session state
+
+    The worker collects streamed items and the latest status message; pages read them with
+    items() and status while polling, and result() once done() is True.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.status = "⏳ Waiting for a free worker..."
+        self._items: List[Any] = []
+        self._lock = threading.Lock()
+        self._future = Future()
+        self._subscribers = 1
+        self.cancelled = False
+
+    def _add_item(self, item: Any):
+        with self._lock:
+            self._items.append(item)
+
+    def _set_status(self, message: str):
+        self.status = message
+
+    def items(self) -> List[Any]:
+        """Get the items streamed in so far"""
+        with self._lock:
+            return list(self._items)
+
+    def done(self) -> bool:
+        """Check if the generation has finished (or was cancelled before it started)"""
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Get the generation's result, raising its exception if it failed"""
+        return self._future.result(timeout=timeout)
+
+
+class JobQueue:
+    """SQLite-backed priority queue of AI generation jobs with an in-process dispatcher
+
+    A job names a GeminiHelper method and its JSON arguments, so queued jobs survive restarts.
+    Workers always take the queued job with the lowest priority value after aging: every
+    aging_seconds a job has waited counts as one priority level, so bulk work is never starved.
+    Background (prefetch and nightly) jobs use at most background_workers of the workers, which
+    keeps the rest free for interactive jobs, and workers pass their job's priority to the rate
+    limiter so interactive calls also go first when waiting for API quota.
+
+    Each process runs its own dispatcher and only takes its own jobs, so a page can poll the Job
+    handle it got from submit(); jobs of a process that stopped (no heartbeat for
+    OWNER_TIMEOUT_SECONDS) are adopted by the next dispatcher that notices. Submitting a job
+    identical to one this process has queued or running returns the existing handle.
+    """
+
+    def __init__(self, db_path: Path, aging_seconds: float):
+        self._db_path = db_path
+        self._aging_seconds = aging_seconds
+        self._owner = uuid.uuid4().hex
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._helper = None
+        self._handles: Dict[str, Job] = {}
+        self._background_workers = 0
+        self._background_running = 0
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get the connection for the current thread (sqlite3 connections are not thread-safe)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self._db_path)
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """Create tables and indexes if they don't exist"""
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ai_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                owner TEXT NOT NULL,
+                key TEXT NOT NULL,
+                page TEXT,
+                method TEXT NOT NULL,
+                args TEXT NOT NULL,
+                kwargs TEXT NOT NULL,
+                stream INTEGER NOT NULL DEFAULT 0,
+                priority INTEGER NOT NULL,
+                enqueued_at REAL NOT NULL,
+                state TEXT NOT NULL DEFAULT 'queued',
+                UNIQUE (owner, key)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_jobs_claim ON ai_jobs(owner, state, priority)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ai_job_owners (
+                owner TEXT PRIMARY KEY,
+                heartbeat REAL NOT NULL
+            )
+        """)
+
+    def _transaction(self, func):
+        """Run func(conn) in a write transaction"""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(conn)
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def start(self, helper, max_workers: Optional[int] = None, background_workers: Optional[int] = None) -> bool:
+        """Start this process's dispatcher once; returns True if started by this call
+
+        Defaults are jobs.max_workers workers, of which prefetch.max_workers may run background jobs.
+        """
+        with self._lock:
+            if self._helper is not None:
+                return False
+            self._helper = helper
+            max_workers = max_workers or config.jobs_max_workers
+            self._background_workers = min(background_workers or config.prefetch_max_workers, max_workers)
+        self._heartbeat()
+        threading.Thread(target=self._beat, name="ai-job-heartbeat", daemon=True).start()
+        for i in range(max_workers):
+            threading.Thread(target=self._work, name=f"ai-job-{i}", daemon=True).start()
+        return True
+
+    @staticmethod
+    def _key(method: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        return hashlib.md5(json.dumps([method, list(args), kwargs], sort_keys=True).encode()).hexdigest()
+
+    def submit(self, page_name: Optional[str], method: str, args: tuple = (), priority: int = INTERACTIVE,
+               stream: bool = False, dedupe: bool = True, **kwargs) -> Job:
+        """Queue helper.method(*args, on_status=..., **kwargs); args and kwargs must be JSON-serializable
+
+        With stream, on_item is passed too and the job collects items as they arrive. An identical
+        queued or running job is joined instead (and raised to this priority) unless dedupe is False.
+        """
+        key = self._key(method, args, kwargs)
+        if not dedupe:
+            key += f"/{uuid.uuid4().hex}"
+        with self._lock:
+            try:
+                self._transaction(lambda conn: conn.execute(
+                    "INSERT INTO ai_jobs (owner, key, page, method, args, kwargs, stream, priority, enqueued_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(owner, key) DO UPDATE SET priority = MIN(priority, excluded.priority), "
+                    "stream = MAX(stream, excluded.stream)",
+                    (self._owner, key, page_name, method, json.dumps(list(args)), json.dumps(kwargs),
+                     int(stream), priority, time.time())
+                ))
+            except sqlite3.Error as e:
+                job = Job(key)
+                job._future.set_exception(e)
+                return job
+
+            job = self._handles.get(key)
+            if job is not None:
+                job._subscribers += 1
+            else:
+                job = self._handles[key] = Job(key)
+            self._wakeup.notify()
+            return job
+
+    def cancel(self, job: Job) -> bool:
+        """Drop one session's interest in a job; returns True if the generation was prevented from running
+
+        A job is cancelled once every session that submitted it has cancelled it, if it hasn't
+        started yet. A running generation can't be interrupted; it finishes and its result is still cached.
+        """
+        with self._lock:
+            job._subscribers -= 1
+            if job._subscribers > 0 or job.done():
+                return False
+            try:
+                deleted = self._transaction(lambda conn: conn.execute(
+                    "DELETE FROM ai_jobs WHERE owner = ? AND key = ? AND state = 'queued'", (self._owner, job.key)
+                ).rowcount)
+            except sqlite3.Error:
+                return False
+            if not deleted:
+                return False
+            job.cancelled = True
+            self._handles.pop(job.key, None)
+            return job._future.cancel()
+
+    def _claim(self) -> Optional[Tuple[int, str, str, list, dict, bool, int]]:
+        """Mark the next job to run as running and return it (must hold the lock)"""
+        background_full = self._background_running >= self._background_workers
+
+        def claim(conn: sqlite3.Connection):
+            row = conn.execute(
+                "SELECT id, key, method, args, kwargs, stream, priority FROM ai_jobs "
+                "WHERE owner = ? AND state = 'queued' AND (? = 0 OR priority = ?) "
+                "ORDER BY priority - (? - enqueued_at) / ?, id LIMIT 1",
+                (self._owner, int(background_full), INTERACTIVE, time.time(), self._aging_seconds)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE ai_jobs SET state = 'running' WHERE id = ?", (row[0],))
+            return row
+
+        row = self._transaction(claim)
+        if row is None:
+            return None
+        job_id, key, method, args, kwargs, stream, priority = row
+        if priority != INTERACTIVE:
+            self._background_running += 1
+        return job_id, key, method, json.loads(args), json.loads(kwargs), bool(stream), priority
+
+    def _work(self):
+        """Worker thread: run claimed jobs, most urgent first"""
+        while True:
+            with self._lock:
+                try:
+                    claimed = self._claim()
+                except sqlite3.Error:
+                    claimed = None
+                if claimed is None:
+                    # Woken by submit(); the timeout lets held-back background jobs and adopted jobs run
+                    self._wakeup.wait(timeout=1.0)
+                    claimed_job = None
+                else:
+                    job_id, key, method, args, kwargs, stream, priority = claimed
+                    # Jobs adopted from another process get their handle now; the result is cached either way
+                    claimed_job = self._handles.setdefault(key, Job(key))
+            if claimed is None:
+                continue
+            self._run(claimed_job, job_id, method, args, kwargs, stream, priority)
+
+    def _run(self, job: Job, job_id: int, method: str, args: list, kwargs: dict, stream: bool, priority: int):
+        job._set_status("⏳ Generating fresh AI content...")
+        if stream:
+            kwargs['on_item'] = job._add_item
+        try:
+            generate_func = getattr(self._helper, method)
+            with rate_limiter.priority(priority):
+                result = generate_func(*args, on_status=job._set_status, **kwargs)
+        except Exception as e:
+            job._future.set_exception(e)
+        else:
+            job._future.set_result(result)
+        finally:
+            with self._lock:
+                if priority != INTERACTIVE:
+                    self._background_running -= 1
+                if self._handles.get(job.key) is job:
+                    del self._handles[job.key]
+                try:
+                    self._transaction(lambda conn: conn.execute("DELETE FROM ai_jobs WHERE id = ?", (job_id,)))
+                except sqlite3.Error:
+                    pass
+                # A background slot may have freed up
+                self._wakeup.notify_all()
+
+    def _beat(self):
+        """Heartbeat thread, independent of how long the workers' jobs take"""
+        while True:
+            time.sleep(HEARTBEAT_SECONDS)
+            self._heartbeat()
+
+    def _heartbeat(self):
+        """Mark this dispatcher alive and adopt the jobs of dispatchers that have stopped"""
+        now = time.time()
+
+        def adopt(conn: sqlite3.Connection) -> int:
+            conn.execute("INSERT OR REPLACE INTO ai_job_owners (owner, heartbeat) VALUES (?, ?)", (self._owner, now))
+            dead = [row[0] for row in conn.execute(
+                "SELECT owner FROM ai_job_owners WHERE heartbeat < ?", (now - OWNER_TIMEOUT_SECONDS,)
+            )]
+            # Jobs queued before owners were tracked, or by a process that never sent a heartbeat
+            dead += [row[0] for row in conn.execute(
+                "SELECT DISTINCT owner FROM ai_jobs WHERE owner NOT IN (SELECT owner FROM ai_job_owners)"
+            )]
+            adopted = 0
+            for owner in dead:
+                # Interrupted jobs run again; duplicates of jobs this process already has are dropped
+                adopted += conn.execute(
+                    "UPDATE OR IGNORE ai_jobs SET owner = ?, state = 'queued' WHERE owner = ?", (self._owner, owner)
+                ).rowcount
+                conn.execute("DELETE FROM ai_jobs WHERE owner = ?", (owner,))
+                conn.execute("DELETE FROM ai_job_owners WHERE owner = ?", (owner,))
+            return adopted
+
+        try:
+            if self._transaction(adopt):
+                with self._lock:
+                    self._wakeup.notify_all()
+        except sqlite3.Error:
+            pass
+
+    def pending(self) -> Dict[str, int]:
+        """Get the number of queued and running jobs of every process, per priority name"""
+        try:
+            rows = self._conn().execute("SELECT priority, COUNT(*) FROM ai_jobs GROUP BY priority").fetchall()
+        except sqlite3.Error:
+            return {}
+        return {PRIORITY_NAMES.get(priority, str(priority)): count for priority, count in rows}
+
+
+# Singleton instance
+jobs = JobQueue(Path(__file__).parent.parent / ".cache" / "responses.db", aging_seconds=config.jobs_aging_seconds)
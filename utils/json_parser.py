@@ -0,0 +1,150 @@
+"""
+JSON parsing helpers for THY Cadet Pilot Prep App
+Incremental parsing of JSON arrays streamed from Gemini, and salvaging of malformed ones
+"""
+
+import json
+import re
+from typing import Any, Dict, List
+
+# A comma directly before a closing bracket/brace (invalid in JSON, common in model output)
+TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class JSONArrayStreamParser:
+    """Incrementally parses a streamed JSON array, returning each element as soon as it is complete
+
+    Text before the opening bracket (e.g. a ```json code fence) and after the closing bracket is ignored.
+    """
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self._text = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._item_start = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the closing bracket of the top-level array has been seen"""
+        return self._finished
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Add a chunk of text and return the elements completed by it"""
+        completed = []
+        self._text += chunk
+        text = self._text
+        i = self._pos
+
+        while i < len(text) and not self._finished:
+            ch = text[i]
+
+            if not self._started:
+                if ch == '[':
+                    self._started = True
+                    self._depth = 1
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                i += 1
+                continue
+
+            if self._item_start is None:
+                # Between elements of the top-level array
+                if ch in ' \t\r\n,':
+                    i += 1
+                    continue
+                if ch == ']':
+                    self._finished = True
+                    i += 1
+                    continue
+                self._item_start = i
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in '[{':
+                self._depth += 1
+            elif ch in ']}':
+                if self._depth == 1:
+                    # Closing bracket of the top-level array ends a scalar element
+                    self._emit(text[self._item_start:i], completed)
+                    self._finished = True
+                    i += 1
+                    continue
+                self._depth -= 1
+                if self._depth == 1:
+                    self._emit(text[self._item_start:i + 1], completed)
+            elif ch == ',' and self._depth == 1:
+                self._emit(text[self._item_start:i], completed)
+
+            i += 1
+
+        # Drop consumed text so the buffer only holds the element in progress
+        keep_from = self._item_start if self._item_start is not None else i
+        self._text = text[keep_from:]
+        self._pos = i - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+        return completed
+
+    def _emit(self, raw: str, completed: List[Any]):
+        """Decode a complete element (repairing trailing commas if needed) and record it"""
+        self._item_start = None
+        try:
+            item = json.loads(raw)
+        except json.JSONDecodeError:
+            try:
+                item = json.loads(TRAILING_COMMA.sub(r"\1", raw))
+            except json.JSONDecodeError:
+                return
+        self.items.append(item)
+        completed.append(item)
+
+
+def salvage_json_array(text: str) -> List[Any]:
+    """Recover every complete element from a malformed JSON array
+
+    Tolerates prose or code fences around the array, trailing commas and a truncated final
+    element (which is dropped). Prose can itself contain brackets (e.g. "[Note] Here are the
+    items: [...]"), so each '[' is tried in turn and the first one yielding elements wins.
+    Bare objects without an enclosing array are also collected.
+    """
+    start = text.find('[')
+    while start != -1:
+        parser = JSONArrayStreamParser()
+        parser.feed(text[start:])
+        if parser.items:
+            return parser.items
+        start = text.find('[', start + 1)
+    if '{' in text:
+        parser = JSONArrayStreamParser()
+        parser.feed('[' + text[text.index('{'):])
+        return parser.items
+    return []
+
+
+def salvage_json_sections(text: str, keys: List[str]) -> Dict[str, List[Any]]:
+    """Recover the arrays under each key of a malformed JSON object such as {"fleet": [...], ...}
+
+    Each section is salvaged independently, so one truncated or broken section doesn't lose the others.
+    """
+    sections = {}
+    for key in keys:
+        match = re.search(r'(?<!\\)"' + re.escape(key) + r'"\s*:\s*\[', text)
+        if match:
+            parser = JSONArrayStreamParser()
+            parser.feed(text[match.end() - 1:])
+            if parser.items:
+                sections[key] = parser.items
+    return sections
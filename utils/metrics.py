@@ -0,0 +1,157 @@
+"""
+Gemini Call Metrics for THY Cadet Pilot Prep App
+Records every generation (latency, tokens, cache tier, outcome) to a JSONL log and rolling in-memory window
+"""
+
+import atexit
+import json
+import math
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.config import config
+
+# Latency histogram bucket upper bounds in milliseconds (the last bucket is open-ended)
+LATENCY_BUCKETS_MS = [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list (None if empty)"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _bucket_label(index: int) -> str:
+    if index == 0:
+        return f"≤{LATENCY_BUCKETS_MS[0]}ms"
+    if index == len(LATENCY_BUCKETS_MS):
+        return f">{LATENCY_BUCKETS_MS[-1]}ms"
+    return f"{LATENCY_BUCKETS_MS[index - 1]}–{LATENCY_BUCKETS_MS[index]}ms"
+
+
+def summarize(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate call events into counts, latency percentiles, token totals and cache hit ratios
+    
+    cache_hit_ratio counts exact hits only; hits on near-identical prompts are in semantic_hit_ratio.
+    """
+    events = list(events)
+    latencies = sorted(e['wall_ms'] for e in events)
+    cache_checked = [e for e in events if e.get('cache_tier')]
+    cache_hits = [e for e in cache_checked if e['cache_tier'] in ('memory', 'disk')]
+    semantic_hits = [e for e in cache_checked if e['cache_tier'] == 'semantic']
+    outcomes: Dict[str, int] = {}
+    for e in events:
+        outcomes[e['outcome']] = outcomes.get(e['outcome'], 0) + 1
+    return {
+        'calls': len(events),
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'prompt_tokens': sum(e.get('prompt_tokens', 0) for e in events),
+        'response_tokens': sum(e.get('response_tokens', 0) for e in events),
+        'cache_hit_ratio': len(cache_hits) / len(cache_checked) if cache_checked else None,
+        'semantic_hit_ratio': len(semantic_hits) / len(cache_checked) if cache_checked else None,
+        'outcomes': outcomes,
+    }
+
+
+class CallMetrics:
+    """Process-wide recorder of Gemini generation calls
+
+    Each call is kept in a rolling window of the last window_size calls for percentiles and histograms,
+    and queued for a background writer thread that appends it as one JSON line to log_file (rotated to
+    log_file.1 at max_log_bytes), so recording never waits on disk I/O.
+    """
+
+    def __init__(self, log_file: Path, window_size: int, max_log_bytes: int):
+        self._log_file = log_file
+        self._max_log_bytes = max_log_bytes
+        self._events = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+        self._pending: "queue.Queue[str]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    def record(self, **fields):
+        """Record a call; fields should include page, model, outcome, wall_ms and token counts"""
+        if not config.metrics_enabled:
+            return
+        event = {'timestamp': datetime.now().isoformat(), **fields}
+        with self._lock:
+            self._events.append(event)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="metrics-writer", daemon=True)
+                self._writer.start()
+        self._pending.put(json.dumps(event) + "\n")
+
+    def flush(self):
+        """Block until every recorded call has been written to the log"""
+        if self._writer is not None:
+            self._pending.join()
+
+    def _write_loop(self):
+        """Append queued events to the log, a batch per file open (runs on the writer thread)"""
+        while True:
+            lines = [self._pending.get()]
+            while True:
+                try:
+                    lines.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._rotate_if_needed()
+                with open(self._log_file, 'a', encoding='utf-8') as f:
+                    f.write("".join(lines))
+            except IOError:
+                # Metrics must never break a generation
+                pass
+            finally:
+                for _ in lines:
+                    self._pending.task_done()
+
+    def _rotate_if_needed(self):
+        """Move a full log aside (writer thread only)"""
+        try:
+            if self._log_file.stat().st_size >= self._max_log_bytes:
+                os.replace(self._log_file, self._log_file.with_name(self._log_file.name + ".1"))
+        except FileNotFoundError:
+            pass
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Get the calls in the rolling window, oldest first"""
+        with self._lock:
+            return list(self._events)
+
+    def summary(self, group_by: Optional[str] = None) -> Dict[str, Any]:
+        """Summarize the rolling window, overall or per value of an event field (e.g. 'page', 'model')"""
+        events = self.events()
+        if group_by is None:
+            return summarize(events)
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for e in events:
+            groups.setdefault(str(e.get(group_by) or '—'), []).append(e)
+        return {name: summarize(group) for name, group in sorted(groups.items())}
+
+    def latency_histogram(self) -> Dict[str, int]:
+        """Count calls in the rolling window per latency bucket"""
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for e in self.events():
+            index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if e['wall_ms'] <= bound),
+                         len(LATENCY_BUCKETS_MS))
+            counts[index] += 1
+        return {_bucket_label(i): count for i, count in enumerate(counts)}
+
+
+# Singleton instance
+metrics = CallMetrics(
+    Path(__file__).parent.parent / ".cache" / "gemini_calls.jsonl",
+    window_size=config.metrics_window_size,
+    max_log_bytes=int(config.metrics_max_log_mb * 1024 * 1024)
+)
@@ -0,0 +1,190 @@
+"""
+Offline AI Precompute for THY Cadet Pilot Prep App
+Pre-generates all AI content into the cache/history stores and ships it as a portable bundle
+
+Usage:
+    python -m utils.precompute                      # generate every enabled page
+    python -m utils.precompute run --export FILE    # generate, then write a bundle
+    python -m utils.precompute export FILE          # bundle the content saved so far
+    python -m utils.precompute import FILE          # load a bundle into this deployment
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import data
+from utils.config import config
+from utils.jobs import jobs, NIGHTLY
+
+BUNDLE_FORMAT = 'thy-cadet-ai-bundle'
+BUNDLE_VERSION = 1
+
+_boot_lock = threading.Lock()
+_boot_loaded = False
+
+
+def _jobs(helper, pages: Optional[List[str]]) -> List[Tuple[str, str, tuple]]:
+    """Build (name, method, args) for every enabled page generator, with the arguments the pages pass"""
+    generators = data.ai_page_generators()
+    wanted = lambda page_name: (pages is None or page_name in pages) and config.is_ai_enabled_for(page_name)
+    specs = []
+
+    # Insight pages share one API call where possible
+    batch = {}
+    if config.gemini_batch_insights:
+        batch = {
+            page_name: args for page_name, (method, args) in generators.items()
+            if helper.BATCHABLE_INSIGHTS.get(page_name, (None,))[0] == method and wanted(page_name)
+        }
+        if len(batch) < 2:
+            batch = {}
+    if batch:
+        specs.append(('+'.join(batch), 'get_insights_batch', (batch,)))
+
+    for page_name, (method, args) in generators.items():
+        if page_name not in batch and wanted(page_name):
+            specs.append((page_name, method, args))
+    return specs
+
+
+def _describe(result: Any) -> str:
+    if isinstance(result, dict):
+        return ', '.join(f"{page}: {len(items)} items" for page, items in result.items())
+    if isinstance(result, list):
+        return f"{len(result)} items" if result else "no valid items"
+    return "ok" if result else "no response"
+
+
+def run(helper, pages: Optional[List[str]] = None, max_workers: Optional[int] = None) -> int:
+    """Generate fresh content for every enabled page with bounded parallelism; returns the number of failures
+
+    Generations are queued as nightly-priority jobs (see utils.jobs), so jobs left over from an
+    interrupted run are picked up again later. Generators validate and de-duplicate items and write
+    them to the response cache and page history. Unknown page names count as failures.
+    """
+    if not helper.is_available:
+        print("Gemini is not available: check gemini.enabled and the API key (or use an offline backend).")
+        return 1
+    if helper._get_model() is None:
+        print(f"Model '{config.gemini_model}' is not available for this API key; set gemini.model in config.yaml.")
+        return 1
+
+    unknown = sorted(set(pages or ()) - set(data.ai_page_generators()))
+    for page_name in unknown:
+        print(f"  ✗ {page_name}: no such AI page (choose from {', '.join(data.ai_page_generators())})")
+    specs = _jobs(helper, pages)
+    if not specs:
+        print("Nothing to precompute: no enabled AI pages (see ai_enhancements in config.yaml).")
+        return len(unknown)
+
+    workers = max_workers or config.precompute_max_workers
+    print(f"Precomputing {len(specs)} jobs with {workers} workers...")
+    jobs.start(helper, max_workers=workers, background_workers=workers)
+    handles = [
+        (name, jobs.submit(name, method, args, priority=NIGHTLY, use_cache=False))
+        for name, method, args in specs
+    ]
+    failures = len(unknown)
+    for name, job in handles:
+        try:
+            result = job.result()
+        except Exception as e:
+            print(f"  ✗ {name}: {e}")
+            failures += 1
+            continue
+        empty = not result or (isinstance(result, dict) and not all(result.values()))
+        failures += 1 if empty else 0
+        print(f"  {'✗' if empty else '✓'} {name}: {_describe(result)}")
+    return failures
+
+
+def export_bundle(helper, path: Path) -> Dict[str, int]:
+    """Write all saved AI content (response cache + page histories) to a gzipped JSON bundle"""
+    content = helper.export_saved_content()
+    bundle = {
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'created_at': datetime.now().isoformat(),
+        **content,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(bundle, f)
+    return {'cache': len(content['cache']), 'history': sum(len(e) for e in content['history'].values())}
+
+
+def import_bundle(helper, path: Path) -> Tuple[int, int]:
+    """Load a bundle written by export_bundle; returns (cache entries, history entries) added"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        bundle = json.load(f)
+    if bundle.get('format') != BUNDLE_FORMAT or bundle.get('version') != BUNDLE_VERSION:
+        raise ValueError(f"{path} is not a version {BUNDLE_VERSION} AI content bundle")
+    return helper.import_saved_content(bundle)
+
+
+def load_bundle_at_boot(helper) -> bool:
+    """Import precompute.bundle_file once per process if it exists; returns True if it was imported
+
+    Importing is idempotent, so every process (and every restart) can safely do this.
+    """
+    global _boot_loaded
+    with _boot_lock:
+        if _boot_loaded:
+            return False
+        _boot_loaded = True
+        path = config.precompute_bundle_file
+        if not path.exists():
+            return False
+        try:
+            import_bundle(helper, path)
+        except (OSError, ValueError, KeyError, json.JSONDecodeError):
+            return False
+        return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.precompute",
+                                     description="Pre-generate AI content and export/import it as a bundle")
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help="generate fresh content for every enabled page (default)")
+    run_parser.add_argument('--pages', nargs='+', help="only these pages (e.g. fleet news dictionary)")
+    run_parser.add_argument('--workers', type=int, help="concurrent requests (default: precompute.max_workers)")
+    run_parser.add_argument('--export', type=Path, metavar='FILE', help="write a bundle afterwards")
+
+    export_parser = subparsers.add_parser('export', help="bundle the content saved so far")
+    export_parser.add_argument('file', type=Path, nargs='?', default=config.precompute_bundle_file)
+
+    import_parser = subparsers.add_parser('import', help="load a bundle into the local stores")
+    import_parser.add_argument('file', type=Path, nargs='?', default=config.precompute_bundle_file)
+
+    args = parser.parse_args(argv)
+
+    from utils.gemini_helper import gemini
+
+    if args.command == 'export':
+        counts = export_bundle(gemini, args.file)
+        print(f"Exported {counts['cache']} cached responses and {counts['history']} history entries to {args.file}")
+        return 0
+
+    if args.command == 'import':
+        cache_added, history_added = import_bundle(gemini, args.file)
+        print(f"Imported {cache_added} cached responses and {history_added} history entries from {args.file}")
+        return 0
+
+    failures = run(gemini, pages=getattr(args, 'pages', None), max_workers=getattr(args, 'workers', None))
+    export_file = getattr(args, 'export', None)
+    if export_file:
+        counts = export_bundle(gemini, export_file)
+        print(f"Exported {counts['cache']} cached responses and {counts['history']} history entries to {export_file}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+AI Prefetch Engine for THY Cadet Pilot Prep App
+Warms the response cache for every AI-enabled page in the background when the app loads
+"""
+
+import threading
+from typing import Callable, Dict
+
+from utils import data
+from utils.config import config
+from utils.jobs import jobs, Job, PREFETCH
+
+
+class PrefetchEngine:
+    """Queues page generators as prefetch-priority jobs to warm the cache before users open the pages
+
+    Generator arguments come from utils.data exactly as the pages pass them, so prefetching works on
+    a fresh deployment or empty cache and hits the same cache keys as the pages. Prefetch jobs run
+    behind interactive ones, at most prefetch.max_workers at a time (see utils.jobs).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Job] = {}
+        self._refreshes: Dict[str, Job] = {}
+        self._started = False
+
+    def start(self, helper) -> bool:
+        """Start prefetching all enabled pages once per process; returns True if started by this call"""
+        with self._lock:
+            if self._started or not config.prefetch_enabled or not helper.is_available:
+                return False
+            self._started = True
+
+        # Resolve the model in the calling script thread, since selection may need the UI
+        if helper._get_model_interactive() is None:
+            with self._lock:
+                self._started = False
+            return False
+
+        generators = {
+            page_name: generator for page_name, generator in data.ai_page_generators().items()
+            if config.is_ai_enabled_for(page_name)
+        }
+
+        # Insight pages that can share one API call are prefetched together
+        batch = {}
+        if config.gemini_batch_insights:
+            batch = {
+                page_name: args for page_name, (method, args) in generators.items()
+                if helper.BATCHABLE_INSIGHTS.get(page_name, (None,))[0] == method
+            }
+            if len(batch) < 2:
+                batch = {}
+
+        jobs.start(helper)
+        with self._lock:
+            if batch:
+                job = jobs.submit('+'.join(batch), 'get_insights_batch', (batch,), priority=PREFETCH, use_cache=True)
+                for page_name in batch:
+                    self._futures[page_name] = job
+            for page_name, (method, args) in generators.items():
+                if page_name not in batch:
+                    self._futures[page_name] = jobs.submit(page_name, method, args, priority=PREFETCH, use_cache=True)
+        return True
+
+    def refresh(self, page_name: str, generate_func: Callable, generate_args: tuple):
+        """Regenerate a page's content in the background unless a refresh is already queued or running"""
+        with self._lock:
+            running = self._refreshes.get(page_name)
+            if running is not None and not running.done():
+                return
+            self._refreshes[page_name] = jobs.submit(
+                page_name, generate_func.__name__, tuple(generate_args), priority=PREFETCH, use_cache=False
+            )
+
+    def is_refreshing(self, page_name: str) -> bool:
+        """Check if a background refresh for a page is still running"""
+        with self._lock:
+            running = self._refreshes.get(page_name)
+            return running is not None and not running.done()
+
+    def status(self) -> Dict[str, int]:
+        """Get counts of prefetched pages that are done and still pending"""
+        with self._lock:
+            done = sum(1 for f in self._futures.values() if f.done())
+            return {'done': done, 'pending': len(self._futures) - done}
+
+
+# Singleton instance
+prefetch = PrefetchEngine()
@@ -0,0 +1,166 @@
+"""
+Rate Limiting and Retry for THY Cadet Pilot Prep App
+Process-wide token buckets for Gemini requests/tokens per minute, plus capped exponential backoff
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from utils.config import config
+
+# HTTP status codes worth retrying: rate limited or transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class QueueTimeoutError(TimeoutError):
+    """Raised when a call's deadline passes while it is still waiting for rate limit quota"""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to a per-minute capacity"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self._rate = per_minute / 60.0
+        self._tokens = per_minute
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be taken (0 if available now)"""
+        self._refill()
+        # Never ask for more than a full bucket, or a large request could wait forever
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self._rate
+
+    def take(self, amount: float):
+        """Remove amount from the bucket (may go negative to record overspend)"""
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+
+    def debit(self, amount: float):
+        """Adjust the bucket after the fact, e.g. when actual usage exceeded the estimate"""
+        self._refill()
+        self._tokens -= amount
+
+
+class RateLimiter:
+    """Process-wide rate limiter enforcing requests/min and tokens/min
+
+    Waiting callers are served by priority (lower first, see priority()), then in arrival order.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._queue = []
+        self._priorities = {}
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    @contextmanager
+    def priority(self, level: int) -> Iterator[None]:
+        """Queue this thread's calls at the given priority level (default 0, the most urgent)"""
+        previous = getattr(self._local, 'priority', 0)
+        self._local.priority = level
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def acquire(self, tokens: int, on_wait: Optional[Callable[[int], None]] = None,
+                deadline: Optional[float] = None):
+        """Block until a request of the given token estimate may be sent, by priority then arrival order
+
+        on_wait is called with the caller's 1-based queue position whenever it changes.
+        Raises QueueTimeoutError if the time.monotonic() deadline passes first.
+        """
+        ticket = object()
+        level = getattr(self._local, 'priority', 0)
+        last_position = None
+        with self._cond:
+            # Behind every waiter of the same or a more urgent level
+            index = next((i for i, t in enumerate(self._queue) if self._priorities[t] > level), len(self._queue))
+            self._queue.insert(index, ticket)
+            self._priorities[ticket] = level
+            try:
+                while True:
+                    # Time until quota frees up is only known once at the head of the queue
+                    wait = 0.0
+                    if self._queue[0] is ticket:
+                        wait = max(self._requests.wait_time(1), self._tokens.wait_time(tokens))
+                        if wait <= 0:
+                            self._requests.take(1)
+                            self._tokens.take(tokens)
+                            return
+
+                    if deadline is not None and time.monotonic() + wait > deadline:
+                        raise QueueTimeoutError("Timed out waiting for Gemini API quota")
+
+                    position = self._queue.index(ticket) + 1
+                    if on_wait and position != last_position:
+                        last_position = position
+                        on_wait(position)
+                    self._cond.wait(timeout=min(wait, 1.0) if wait else 1.0)
+            finally:
+                self._queue.remove(ticket)
+                del self._priorities[ticket]
+                self._cond.notify_all()
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """Charge the difference between actual and estimated token usage"""
+        if actual_tokens > estimated_tokens:
+            with self._cond:
+                self._tokens.debit(actual_tokens - estimated_tokens)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check if an API error is a rate limit (429) or transient server (5xx) error"""
+    code = getattr(error, 'code', None)
+    # google.api_core exceptions expose the HTTP status as .code
+    return isinstance(code, int) and code in RETRYABLE_STATUS_CODES
+
+
+def backoff_delay(attempt: int) -> float:
+    """Capped exponential backoff with full jitter for the given retry attempt (0-based)"""
+    delay = min(config.rate_limit_backoff_max_seconds, config.rate_limit_backoff_base_seconds * (2 ** attempt))
+    return random.uniform(0, delay)
+
+
+def call_with_retry(func: Callable[[], Any], on_retry: Optional[Callable[[int, float, Exception], None]] = None,
+                    can_retry: Optional[Callable[[], bool]] = None, deadline: Optional[float] = None) -> Any:
+    """Call func, retrying retryable errors up to rate_limit.max_retries times with backoff
+
+    on_retry is called with (attempt, delay, error) before sleeping; can_retry lets the caller veto
+    a retry (e.g. when part of a streamed response has already been delivered). No retry is made
+    if its backoff would run past the time.monotonic() deadline.
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= config.rate_limit_max_retries or not is_retryable(e):
+                raise
+            if can_retry is not None and not can_retry():
+                raise
+            delay = backoff_delay(attempt)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise
+            if on_retry:
+                on_retry(attempt + 1, delay, e)
+            time.sleep(delay)
+            attempt += 1
+
+
+# Singleton instance
+rate_limiter = RateLimiter(config.rate_limit_requests_per_minute, config.rate_limit_tokens_per_minute)
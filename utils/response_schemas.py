@@ -0,0 +1,71 @@
+"""
+Gemini Response Schemas for THY Cadet Pilot Prep App
+Per-page JSON schemas used to request structured output (JSON mode)
+"""
+
+from typing import Any, Dict, List
+
+
+def _array_of(properties: Dict[str, Dict[str, Any]], required: List[str]) -> Dict[str, Any]:
+    """Build a schema for a JSON array of objects"""
+    return {
+        'type': 'array',
+        'items': {
+            'type': 'object',
+            'properties': properties,
+            'required': required
+        }
+    }
+
+
+_STRING = {'type': 'string'}
+
+INSIGHT_SCHEMA = _array_of(
+    {'title': _STRING, 'category': _STRING, 'content': _STRING, 'interview_tip': _STRING},
+    ['title', 'category', 'content', 'interview_tip']
+)
+
+RESPONSE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    'dictionary': _array_of(
+        {'term': _STRING, 'full_name': _STRING, 'category': _STRING, 'difficulty': _STRING, 'definition': _STRING},
+        ['term', 'full_name', 'category', 'difficulty', 'definition']
+    ),
+    'news': _array_of(
+        {'title': _STRING, 'date': _STRING, 'category': {'type': 'array', 'items': _STRING},
+         'content': _STRING, 'interview_tip': _STRING},
+        ['title', 'date', 'category', 'content', 'interview_tip']
+    ),
+    'history': _array_of(
+        {'year': {'type': 'integer'}, 'era': _STRING, 'title': _STRING, 'content': _STRING},
+        ['year', 'era', 'title', 'content']
+    ),
+    'fleet': INSIGHT_SCHEMA,
+    'destinations': INSIGHT_SCHEMA,
+    'future': _array_of(
+        {'title': _STRING, 'timeline': _STRING, 'category': _STRING, 'content': _STRING, 'interview_tip': _STRING},
+        ['title', 'timeline', 'category', 'content', 'interview_tip']
+    ),
+}
+
+# Field identifying an item when removing duplicates, per page (default 'title')
+ITEM_KEYS = {'dictionary': 'term'}
+
+
+def validate_items(page_name: str, items: List[Any]) -> List[Dict[str, Any]]:
+    """Keep items that are objects with every required field filled in, dropping repeats of an earlier item"""
+    schema = RESPONSE_SCHEMAS.get(page_name)
+    if schema is None:
+        return items
+    required = schema['items']['required']
+    key_field = ITEM_KEYS.get(page_name, 'title')
+    valid = []
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict) or any(item.get(field) in (None, '', []) for field in required):
+            continue
+        key = str(item.get(key_field, '')).strip().lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        valid.append(item)
+    return valid
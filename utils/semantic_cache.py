@@ -0,0 +1,143 @@
+"""
+Semantic Response Cache for THY Cadet Pilot Prep App
+Finds cached responses for near-identical prompt inputs using local hashed TF-IDF vectors
+"""
+
+import math
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+# Hashing-trick feature space; collisions are rare at this size for prompt-sized vocabularies
+N_FEATURES = 2 ** 20
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+Vector = Dict[int, float]
+
+
+def hashed_term_counts(text: str) -> Counter:
+    """Count lowercase word tokens of text, hashed into N_FEATURES buckets"""
+    return Counter(zlib.crc32(token.encode()) % N_FEATURES for token in TOKEN_PATTERN.findall(text.lower()))
+
+
+def _cosine(a: Vector, b: Vector) -> float:
+    """Cosine similarity of two L2-normalized sparse vectors (two empty inputs are identical)"""
+    if not a or not b:
+        return 1.0 if not a and not b else 0.0
+    if len(b) < len(a):
+        a, b = b, a
+    return sum(w * b.get(feature, 0.0) for feature, w in a.items())
+
+
+class SemanticCache:
+    """In-memory nearest-neighbour index from prompt inputs to exact cache keys
+
+    Entries are grouped by scope (a page's prompt template and cache generation), so only prompts
+    built from the same template are compared. Each input is vectorized separately with TF-IDF over
+    the entries in its scope, and two prompts match if every input's cosine similarity reaches the
+    threshold; a prompt for a different aircraft therefore never matches, however similar the rest is.
+    """
+
+    def __init__(self, threshold: float, max_entries: int):
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # cache key -> (scope, per-input term counts), in least recently used order
+        self._entries: "OrderedDict[str, Tuple[str, List[Counter]]]" = OrderedDict()
+        # scope -> feature -> cache keys containing it (candidate lookup)
+        self._postings: Dict[str, Dict[int, Set[str]]] = {}
+        # scope -> feature -> number of entries containing it (document frequency for IDF)
+        self._doc_freq: Dict[str, Counter] = {}
+        self._scope_sizes: Counter = Counter()
+        self._lookups = 0
+        self._hits = 0
+
+    def add(self, cache_key: str, scope: str, inputs: List[str]):
+        """Index a cached response under its normalized prompt inputs"""
+        counts = [hashed_term_counts(text) for text in inputs]
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                return
+            self._entries[cache_key] = (scope, counts)
+            self._scope_sizes[scope] += 1
+            postings = self._postings.setdefault(scope, {})
+            doc_freq = self._doc_freq.setdefault(scope, Counter())
+            for feature in set().union(*counts):
+                postings.setdefault(feature, set()).add(cache_key)
+                doc_freq[feature] += 1
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, cache_key: str):
+        """Drop an entry from the index (must hold the lock)"""
+        scope, counts = self._entries.pop(cache_key)
+        self._scope_sizes[scope] -= 1
+        postings = self._postings[scope]
+        doc_freq = self._doc_freq[scope]
+        for feature in set().union(*counts):
+            postings[feature].discard(cache_key)
+            if not postings[feature]:
+                del postings[feature]
+            doc_freq[feature] -= 1
+            if doc_freq[feature] <= 0:
+                del doc_freq[feature]
+
+    def discard(self, cache_key: str):
+        """Forget an entry, e.g. when its response is no longer in the exact cache"""
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove(cache_key)
+
+    def _vector(self, counts: Counter, scope: str, total: int) -> Vector:
+        """L2-normalized TF-IDF vector (smoothed IDF over the entries in scope; must hold the lock)"""
+        doc_freq = self._doc_freq.get(scope, {})
+        vector = {
+            feature: count * (math.log((1 + total) / (1 + doc_freq.get(feature, 0))) + 1)
+            for feature, count in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        return {feature: w / norm for feature, w in vector.items()} if norm else {}
+
+    def lookup(self, scope: str, inputs: List[str]) -> Optional[Tuple[str, float]]:
+        """Find the most similar indexed prompt in scope; returns (cache key, similarity) above the threshold"""
+        counts = [hashed_term_counts(text) for text in inputs]
+        with self._lock:
+            self._lookups += 1
+            postings = self._postings.get(scope)
+            if not postings:
+                return None
+            candidates = set()
+            for feature in set().union(*counts):
+                candidates |= postings.get(feature, set())
+
+            total = self._scope_sizes[scope]
+            query = [self._vector(c, scope, total) for c in counts]
+            best_key, best_score = None, 0.0
+            for cache_key in candidates:
+                _, entry_counts = self._entries[cache_key]
+                if len(entry_counts) != len(query):
+                    continue
+                # Every input must be similar, so one very different argument rules a match out
+                score = min(_cosine(q, self._vector(c, scope, total)) for q, c in zip(query, entry_counts))
+                if score > best_score:
+                    best_key, best_score = cache_key, score
+
+            if best_key is None or best_score < self._threshold:
+                return None
+            self._entries.move_to_end(best_key)
+            self._hits += 1
+            return best_key, best_score
+
+    def stats(self) -> Dict[str, float]:
+        """Get entry count, lookups, hits and hit rate of the semantic layer"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'lookups': self._lookups,
+                'hits': self._hits,
+                'hit_rate': self._hits / self._lookups if self._lookups else 0.0,
+            }
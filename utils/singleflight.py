@@ -0,0 +1,48 @@
+"""
+Single-flight call coalescing for THY Cadet Pilot Prep App
+Concurrent callers asking for the same key share one in-flight execution
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into a single execution"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+
+    def do(self, key: str, func: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """Run func once per key at a time; returns (result, shared) where shared is True for waiters
+
+        Waiters give up with TimeoutError after timeout seconds (the call itself keeps running).
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return future.result(timeout=timeout), True
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def in_flight(self, key: str) -> bool:
+        """Check whether a call for key is currently running"""
+        with self._lock:
+            return key in self._inflight
@@ -0,0 +1,91 @@
+"""
+AI Term Store for THY Cadet Pilot Prep App
+Every dictionary term Gemini has suggested, keyed by normalized term, in the shared SQLite (WAL mode) database
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from utils.cache_store import connect
+
+NON_ALNUM = re.compile(r"[^0-9a-z]")
+
+
+def normalize_term(term: Any) -> str:
+    """Dedup key for a dictionary term: case-folded with punctuation and spaces removed (V-1 == v1)"""
+    return NON_ALNUM.sub('', str(term).casefold())
+
+
+class AITermStore:
+    """Persistent set of AI-suggested dictionary terms; the first suggestion of a term is kept"""
+
+    def __init__(self, db_path: Path):
+        self._db_path = db_path
+        self._local = threading.local()
+        self._init_schema()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get the connection for the current thread (sqlite3 connections are not thread-safe)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = connect(self._db_path)
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        """Create tables and indexes if they don't exist"""
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ai_terms (
+                key TEXT PRIMARY KEY,
+                term TEXT NOT NULL,
+                data TEXT NOT NULL,
+                added_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_terms_added_at ON ai_terms(added_at)")
+
+    def terms(self) -> List[str]:
+        """Get every stored term as suggested (oldest first)"""
+        try:
+            return [row[0] for row in self._conn().execute("SELECT term FROM ai_terms ORDER BY added_at")]
+        except sqlite3.Error:
+            return []
+
+    def count(self) -> int:
+        """Get the number of stored terms"""
+        try:
+            return self._conn().execute("SELECT COUNT(*) FROM ai_terms").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def add(self, items: List[Dict[str, Any]]) -> int:
+        """Store term entries whose normalized term is not stored yet, atomically; returns the number added"""
+        added_at = datetime.now().isoformat()
+        rows = [
+            (normalize_term(item['term']), str(item['term']), json.dumps(item), added_at)
+            for item in items if normalize_term(item.get('term', ''))
+        ]
+        if not rows:
+            return 0
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO ai_terms (key, term, data, added_at) VALUES (?, ?, ?, ?)", rows
+                )
+                added = conn.total_changes - before
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            return 0
+        return added